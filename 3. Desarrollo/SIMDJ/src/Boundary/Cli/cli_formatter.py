@@ -1,9 +1,12 @@
 from __future__ import annotations
+import os
+import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Sequence, List
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Screen:
     title: str
     body: str
@@ -13,28 +16,76 @@ class Screen:
 
 class CLIFormatter:
     LINE = "----------------------------------------"
+    _MESSAGE_TEMPLATES = {
+        "Notification": f"{LINE}\n{{title}}\n{LINE}\n{{msg}}\n[ENTER] Continuar\n{LINE}",
+        "Question": f"{LINE}\n{{msg}}",
+        "Error": f"{LINE}\nError:\n{{title}}\n{LINE}\n{{msg}}\n[ENTER] Continuar\n{LINE}",
+    }
+
+    _CONFIGURATION_MENU_BODY = (
+        "============================================\n"
+        "        Submenú de Configuración\n"
+        "============================================\n"
+        "[1] Editar parámetros del Juego\n"
+        "[2] Definir orden de jugadores\n"
+        "[3] Visualizar Juego en forma de Árbol\n"
+        "[4] Eliminar Juego\n"
+        "[5] Volver al Menú Principal\n"
+        "============================================\n"
+    )
+
+    _SIMULATION_MENU_BODY = (
+        "============================================\n"
+        "        Submenú de Simulación\n"
+        "============================================\n"
+        "[1] Asignar Probabilidad a las Estrategias\n"
+        "[2] Generar y Visualizar Historias \n"
+        "[3] Calcular Utilidades y Equilibrios\n"
+        "[4] Exportar Resultados de Simulación\n"
+        "[5] Volver al Menú Principal\n"
+        "============================================\n"
+    )
+
+    _EXPORT_MENU_BODY = (
+        "=======================================================\n"
+        "                Submenú de Exportación\n"
+        "=======================================================\n"
+        "Seleccione el tipo de exportación que desea realizar:\n"
+        "[1] Exportar Matriz de Probabilidades, Historias y Utilidades (Excel)\n"
+        "[2] Exportar Árbol de decisiones (SVG)\n"
+        "[3] Exportar Ambos\n"
+        "[4] Volver al Submenú de Simulación\n"
+        "=======================================================\n"
+    )
+
+    def __init__(self) -> None:
+        # La terminal se detecta al construir el formateador, no al importar el módulo
+        self._clear_sequence = self._detect_clear_sequence()
+
+    @staticmethod
+    def _detect_clear_sequence() -> str:
+        if not sys.stdout.isatty():
+            return "\n" * 80
+        if os.name == "nt":
+            os.system("")  # Habilita las secuencias VT en la consola de Windows
+        return "\x1b[2J\x1b[H"
 
     def _clear(self) -> None:
-        print("\n" * 80)
+        sys.stdout.write(self._clear_sequence)
 
     def _display_screen(self, screen: Screen) -> None:
-        self._clear()
-        print(screen.title)
-        print(self.LINE)
-        print(screen.body)
+        parts = [self._clear_sequence, screen.title, "\n", self.LINE, "\n", screen.body, "\n"]
         if screen.footer:
-            print(self.LINE)
-            print(screen.footer)
+            parts.extend((self.LINE, "\n", screen.footer, "\n"))
+        sys.stdout.write("".join(parts))
 
     def display_message(self, type: str, title: str, msg: str) -> None:
-        self._clear()
-        match type:
-            case "Notification":
-                print(f"{self.LINE}\n{title}\n{self.LINE}\n{msg}\n[ENTER] Continuar\n{self.LINE}")
-            case "Question":
-                print(f"{self.LINE}\n{msg}")
-            case "Error":
-                print(f"{self.LINE}\nError:\n{title}\n{self.LINE}\n{msg}\n[ENTER] Continuar\n{self.LINE}")
+        template = self._MESSAGE_TEMPLATES.get(type)
+        if template is None:
+            self._clear()
+            return
+        sys.stdout.write(self._clear_sequence + template.format(title=title, msg=msg) + "\n")
+        sys.stdout.flush()
 
     def show_cli_order_intro(self, order_str: str) -> None:
         body = (
@@ -68,8 +119,10 @@ class CLIFormatter:
         )
         self._display_screen(Screen("", body))
 
-    def show_main_menu(self, date_str: str) -> None:
-        body = (
+    @staticmethod
+    @lru_cache(maxsize=2)
+    def _build_main_menu_body(date_str: str) -> str:
+        return (
             "================================================================================\n"
             "                                  SIM-DJ v1.0\n"
             "           Simulador de Toma de Decisiones Basado en Teoría de Juegos\n"
@@ -83,49 +136,18 @@ class CLIFormatter:
             "[4] Salir del Sistema\n"
             "================================================================================\n"
         )
-        self._display_screen(Screen("Menú Principal", body))
+
+    def show_main_menu(self, date_str: str) -> None:
+        self._display_screen(Screen("Menú Principal", self._build_main_menu_body(date_str)))
 
     def show_configuration_menu(self)-> None:
-        body = (
-            "============================================\n"
-            "        Submenú de Configuración\n"
-            "============================================\n"
-            "[1] Editar parámetros del Juego\n"
-            "[2] Definir orden de jugadores\n"
-            "[3] Visualizar Juego en forma de Árbol\n"
-            "[4] Eliminar Juego\n"
-            "[5] Volver al Menú Principal\n"
-            "============================================\n"
-        )
-        self._display_screen(Screen("[2] Configuración de Juego", body))
+        self._display_screen(Screen("[2] Configuración de Juego", self._CONFIGURATION_MENU_BODY))
 
     def show_simulation_menu(self) -> None:
-        body = (
-            "============================================\n"
-            "        Submenú de Simulación\n"
-            "============================================\n"
-            "[1] Asignar Probabilidad a las Estrategias\n"
-            "[2] Generar y Visualizar Historias \n"
-            "[3] Calcular Utilidades y Equilibrios\n"
-            "[4] Exportar Resultados de Simulación\n"
-            "[5] Volver al Menú Principal\n"
-            "============================================\n"
-        )
-        self._display_screen(Screen("[3] Simulación del Juego", body, prompt=""))
+        self._display_screen(Screen("[3] Simulación del Juego", self._SIMULATION_MENU_BODY, prompt=""))
 
     def show_export_menu(self) -> None:
-        body = (
-            "=======================================================\n"
-            "                Submenú de Exportación\n"
-            "=======================================================\n"
-            "Seleccione el tipo de exportación que desea realizar:\n"
-            "[1] Exportar Matriz de Probabilidades, Historias y Utilidades (Excel)\n"
-            "[2] Exportar Árbol de decisiones (SVG)\n"
-            "[3] Exportar Ambos\n"
-            "[4] Volver al Submenú de Simulación\n"
-            "=======================================================\n"
-        )
-        self._display_screen(Screen("[5] Exportar Resultados de Simulación", body, prompt=""))
+        self._display_screen(Screen("[5] Exportar Resultados de Simulación", self._EXPORT_MENU_BODY, prompt=""))
 
     def show_cli_input_players(self) -> None:
         body = (
@@ -171,9 +193,10 @@ class CLIFormatter:
         )
         self._display_screen(Screen("", body))
 
-    def show_cli_payments_prompt(self, idx: int) -> None:
+    def show_cli_payments_prompt(self, idx: int, num_players: int) -> None:
         body = (
             "Ingrese los PAGOS para cada JUGADOR en cada HISTORIA.\n"
+            f"Escriba los {num_players} pagos separados por coma (ejemplo: 3,-1,2)\n"
             "(Escriba “C” en cualquier momento para detener)\n"
             f"{self.LINE}\n"
             f"Historia {idx}:"
@@ -265,8 +288,11 @@ class CLIFormatter:
         )
         self._display_screen(Screen("", body, prompt=""))
 
+    def _format_action_prob_pairs(self, actions: Sequence[str], probs: Sequence[float]) -> str:
+        return "\n".join(map("{} -> {:.2f} |".format, actions, probs))
+
     def show_cli_normalization_done(self,scenario_idx: int, actions: Sequence[str], probs: Sequence[float]) -> None:
-        pairs = "\n".join([f"{a} -> {p:.2f} |" for a, p in zip(actions, probs)])
+        pairs = self._format_action_prob_pairs(actions, probs)
         body = (
             "Normalización completada correctamente.\n"
             f"ESCENARIO {scenario_idx}\n"
@@ -279,7 +305,7 @@ class CLIFormatter:
         self._display_screen(Screen("", body, prompt=""))
 
     def show_cli_probabilities_registered(self, scenario_idx: int, actions: Sequence[str], probs: Sequence[float]) -> None:
-        pairs = "\n".join([f"{a} -> {p:.2f} |" for a, p in zip(actions, probs)])        
+        pairs = self._format_action_prob_pairs(actions, probs)
         body = (
             f"ESCENARIO {scenario_idx}\n"
             f"{self.LINE}\n"            
@@ -371,8 +397,6 @@ class CLIFormatter:
     
     def show_cli_equilibria_with_navigation(self, equilibrium_lines: List[str], 
                                         current: int, total: int) -> None:
-        display_lines = equilibrium_lines.copy()
-        
         if total == 1:
             nav_line = "[ENTER] Continuar"
         else:
@@ -383,10 +407,7 @@ class CLIFormatter:
             else:
                 nav_line = "[a] = Anterior SPE  | [d] = Siguiente SPE"
         
-        display_lines.append("")
-        display_lines.append(nav_line)
-        
-        body = "\n".join(display_lines)
+        body = "\n".join(equilibrium_lines) + "\n\n" + nav_line
         
         self._display_screen(Screen("Análisis de Equilibrios", body, prompt=""))
 
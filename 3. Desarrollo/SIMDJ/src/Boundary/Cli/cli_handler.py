@@ -1,6 +1,9 @@
 from __future__ import annotations
-from typing import Any, List, Optional, Dict
+from typing import Any, List, Optional, Dict, Tuple
 from datetime import datetime
+from functools import lru_cache
+from os.path import basename
+import math
 
 from .cli_formatter import CLIFormatter
 from .command_parser import CommandParser
@@ -18,7 +21,15 @@ from Infrastructure.Common.technical_validator import TechnicalValidator
 from Domain.Common.domain_validator import DomainValidator
 
 
+@lru_cache(maxsize=16)
+def _render_order(player_ids: Tuple[int, ...]) -> str:
+    return " -> ".join(f"J{player_id}" for player_id in player_ids)
+
+
 class CLIHandler:
+    _SPE_NAVIGATION = {"d": 1, "a": -1}
+    _PROBABILITY_TOLERANCE = 0.001
+    _YESNO_MAP = {"s": True, "si": True, "n": False, "no": False}
 
     def __init__(
         self,
@@ -35,6 +46,19 @@ class CLIHandler:
         self.technical_validator = technical_validator
         self.domain_validator = domain_validator
         self.logger = logger
+        self._active_game: bool = self.dispatcher.execute("has_active_game")
+        self._game_summary: Optional[Dict[str, Any]] = None
+        self._configuration_menu = {
+            1: lambda: self._handle_create_game("edición"),
+            2: self._handle_configure_order,
+            3: self._handle_show_tree,
+            4: self._handle_delete_game,
+        }
+        self._export_menu_routes = {
+            1: self._handle_export_excel,
+            2: lambda: self._handle_show_tree("exportación"),
+            3: self._handle_export_both,
+        }
         
 
 
@@ -79,8 +103,7 @@ class CLIHandler:
     # ===========================================================
     def _handle_simulation_menu(self) -> None:
         try:
-            game_summary = self.dispatcher.execute("get_game_summary")
-            if not game_summary["has_active_game"]:
+            if not self._active_game:
                 raise NoActiveGameError()
 
             while True:
@@ -118,6 +141,12 @@ class CLIHandler:
             self._handle_unexpected_error(error)
 
 
+    def _get_game_summary(self) -> Dict[str, Any]:
+        if self._game_summary is None:
+            self._game_summary = self.dispatcher.execute("get_game_summary")
+        return self._game_summary
+
+
     # ===========================================================
     # CU-01 — CREAR JUEGO
     # ===========================================================
@@ -131,9 +160,11 @@ class CLIHandler:
             
             num_players, num_rounds, num_strategies = parameters
             
+            self._game_summary = None
             ok = self.dispatcher.execute("create_game", num_players, num_rounds, num_strategies)
             
             if ok:
+                self._active_game = True
                 self._handle_post_creation(context)
                 
         except GameException as error:
@@ -179,40 +210,58 @@ class CLIHandler:
         return parameters['players'], parameters['rounds'], parameters['strategies']
 
     def _read_parameter(self, prompt_method: callable, context: str) -> Optional[int]:
+        read_input = self.parser.read_input
+        is_cancel = self.parser.is_cancel
+        show_message = self._show_message
+
         while True:
             prompt_method()
-            raw_input = self.parser.read_input("> ").strip()
+            raw_input = read_input("> ").strip()
             
-            if self.parser.is_cancel(raw_input):
+            if is_cancel(raw_input):
                 if self._ask_yes_no_question(f"¿Desea cancelar {context}? (S/N)"):
                     return None
                 else:
                     continue
             
-            if not raw_input.isdigit() or int(raw_input) <= 0:
-                self._show_message(
+            try:
+                value = int(raw_input)
+            except ValueError:
+                show_message(
+                    "Notification",
+                    "Entrada inválida",
+                    "Ingrese un número entero válido."
+                )
+                continue
+
+            if value <= 0:
+                show_message(
                     "Notification",
                     "Entrada inválida",
                     "Ingrese solo números enteros positivos."
                 )
                 continue
             
-            return int(raw_input)
+            return value
 
     def _confirm_parameters(self, context: str, players: int, rounds: int, strategies: int) -> bool:
         complexity_info = self.domain_validator.validate_game_complexity(rounds, strategies)
+        show_summary = self.formatter.show_cli_summary_game_creation
+        read_input = self.parser.read_input
+        show_message = self._show_message
+
         while True:
-            self.formatter.show_cli_summary_game_creation(
+            show_summary(
                 players, rounds, strategies,
                 complexity_info["scenarios"], 
                 complexity_info["strategies"], 
                 context
             )
 
-            answer = self.parser.read_input("\n> ").strip().lower()
+            answer = read_input("\n> ").strip().lower()
         
             if answer in ("n", "no"):
-                self._show_message(
+                show_message(
                     "Notification",
                     "Operación Cancelada", 
                     f"Se ha cancelado la {context} del Juego."
@@ -221,34 +270,32 @@ class CLIHandler:
             elif answer in ("s", "si"):
                 return True
             else:
-                self._show_message(
+                show_message(
                     "Notification",
                     "Respuesta incorrecta",
                     "Solo responda 'S' o 'N'."
                 )
 
     def _handle_post_creation(self, context: str) -> None:
-        game_summary = self.dispatcher.execute("get_game_summary")   
+        game_summary = self._get_game_summary()   
         self._handle_configure_order(context)
         result = self._capture_payoffs(game_summary["total_histories"])
         self._show_final_summary(game_summary, result)
 
     def _capture_payoffs(self, total_histories: int) -> None:
         try:
-            game_summary = self.dispatcher.execute("get_game_summary")
+            game_summary = self._get_game_summary()
             num_players = game_summary["config"]["players"]
+            prompt = f"    Pagos J1..J{num_players}: "
             pay_matrix = []
 
             for history_index in range(1, total_histories + 1):
-                values = []
-                for player_index in range(1, num_players + 1):
-                    value = self._read_payoff_value(player_index, history_index)
-                    if value is None:
-                        return
-                    values.append(value)
-
+                values = self._read_payoffs_row(history_index, num_players, prompt)
+                if values is None:
+                    return
                 pay_matrix.append(values)
 
+            self._game_summary = None
             result = self.dispatcher.execute("register_payoffs", pay_matrix)
 
             if result["success"]:
@@ -259,29 +306,34 @@ class CLIHandler:
         except Exception as error:
             self._handle_unexpected_error(error)
 
-    def _read_payoff_value(self, player_index: int, history_index: int) -> Optional[float]:
-        while True:
-            try:
-                self.formatter.show_cli_payments_prompt(history_index)
-                raw_input = self.parser.read_input(f"    Jugador {player_index}: ").strip()
+    def _read_payoffs_row(self, history_index: int, num_players: int, prompt: str) -> Optional[List[float]]:
+        show_prompt = self.formatter.show_cli_payments_prompt
+        read_input = self.parser.read_input
+        is_cancel = self.parser.is_cancel
+        parse_row = self.parser.parse_payoffs_row
+        show_message = self._show_message
 
-                if self.parser.is_cancel(raw_input):
-                    self._show_message(
-                        "Notification",
-                        "Operación Cancelada", 
-                        "Se canceló la captura de PAGOS."
-                    )
-                    return None
+        while True:
+            show_prompt(history_index, num_players)
+            raw_input = read_input(prompt).strip()
 
-                return float(raw_input)
-            
-            except ValueError:
-                self._show_message(
+            if is_cancel(raw_input):
+                show_message(
                     "Notification",
-                    "Entrada inválida", 
-                    "Ingrese solo valores numéricos."
+                    "Operación Cancelada", 
+                    "Se canceló la captura de PAGOS."
                 )
-            continue
+                return None
+
+            values = parse_row(raw_input, num_players)
+            if values is not None:
+                return values
+
+            show_message(
+                "Notification",
+                "Entrada inválida", 
+                f"Ingrese exactamente {num_players} valores numéricos separados por coma."
+            )
 
     def _show_final_summary(self, game_summary: Dict[str, Any], result: Dict[str, Any]) -> None:
         config = game_summary["config"]
@@ -302,8 +354,7 @@ class CLIHandler:
     # ===========================================================
     def _handle_configure_game(self) -> None:
         try:
-            game_summary = self.dispatcher.execute("get_game_summary")
-            if not game_summary["has_active_game"]:
+            if not self._active_game:
                 raise NoActiveGameError()
 
             while True:
@@ -312,16 +363,12 @@ class CLIHandler:
                     raw_input = self.parser.read_input("> ")
                     option = self.parser.parse_menu_option(raw_input)
 
-                    if option == 1:
-                        self._handle_create_game("edición")
-                    elif option == 2:
-                        self._handle_configure_order()
-                    elif option == 3:
-                        self._handle_show_tree()
-                    elif option == 4:
-                        self._handle_delete_game()
-                    elif option == 5:
+                    if option == 5:
                         return  # Menú principal
+
+                    handler = self._configuration_menu.get(option)
+                    if handler is not None:
+                        handler()
                     else:
                         self._show_message(
                             "Notification",
@@ -342,7 +389,7 @@ class CLIHandler:
 
     def _handle_configure_order(self, context: str=None) -> None:
         try:
-            game_summary = self.dispatcher.execute("get_game_summary")
+            game_summary = self._get_game_summary()
             if not self._ask_to_configure_order(game_summary["player_order"], context):
                 return
             
@@ -352,11 +399,11 @@ class CLIHandler:
             if new_order is None:
                 return
 
+            self._game_summary = None
             ok = self.dispatcher.execute("configure_order", new_order)
             if ok:
-                game_summary = self.dispatcher.execute("get_game_summary")
-                new_order_display = [f"J{player_id}" for player_id in game_summary["player_order"]]
-                new_order_str = " -> ".join(new_order_display)
+                game_summary = self._get_game_summary()
+                new_order_str = _render_order(tuple(game_summary["player_order"]))
                 
                 self.formatter.show_cli_player_order_saved(new_order_str)
                 self.parser.read_input("\n> ")
@@ -371,17 +418,23 @@ class CLIHandler:
         game_summary: Dict[str, Any], 
         players_data: Dict[str, Any]
     ) -> Optional[List[int]]:
-        current_order = [f"J{player_id}" for player_id in game_summary["player_order"]]
-        order_str = " -> ".join(current_order)
+        expected_count = len(game_summary["player_order"])
+        order_str = _render_order(tuple(game_summary["player_order"]))
         players_list = players_data["players_list"]
         num_rounds = game_summary["config"]["rounds"]
 
+        show_order_prompt = self.formatter.show_cli_manual_order_player
+        read_input = self.parser.read_input
+        is_cancel = self.parser.is_cancel
+        validate_positive_integer = self.technical_validator.validate_positive_integer
+        show_message = self._show_message
+
         while True:
-            self.formatter.show_cli_manual_order_player(players_list, order_str, num_rounds)
-            raw_input = self.parser.read_input("\n> ").strip()
+            show_order_prompt(players_list, order_str, num_rounds)
+            raw_input = read_input("\n> ").strip()
 
-            if self.parser.is_cancel(raw_input):
-                self._show_message(
+            if is_cancel(raw_input):
+                show_message(
                     "Notification",
                     "Operación Cancelada",
                     "Se canceló la configuración del orden."
@@ -395,25 +448,26 @@ class CLIHandler:
                 player_ids = []
 
                 for pid_str in player_ids_str:
-                    if not pid_str.isdigit():
+                    try:
+                        pid = int(pid_str)
+                    except ValueError:
                         raise TechnicalValidationError(
                             technical_message=f"ID '{pid_str}' no es numérico",
                             user_message="Todos los IDs deben ser números enteros."
                         )
-                    pid = int(pid_str)
-                    self.technical_validator.validate_positive_integer(pid, "ID de jugador")
+                    validate_positive_integer(pid, "ID de jugador")
                     player_ids.append(pid)
 
-                if len(player_ids) != len(current_order):
+                if len(player_ids) != expected_count:
                     raise TechnicalValidationError(
-                        technical_message=f"Se ingresaron {len(player_ids)} IDs, se esperaban {len(current_order)}",
-                        user_message=f"Debe ingresar exactamente {len(current_order)} IDs separados por coma."
+                        technical_message=f"Se ingresaron {len(player_ids)} IDs, se esperaban {expected_count}",
+                        user_message=f"Debe ingresar exactamente {expected_count} IDs separados por coma."
                     )
 
                 return player_ids
 
             except (TechnicalValidationError, InvalidInputError) as error:
-                self._show_message("Error", type(error).__name__, error.user_message)
+                show_message("Error", type(error).__name__, error.user_message)
                 continue
 
     def _handle_delete_game(self) -> None:
@@ -430,9 +484,11 @@ class CLIHandler:
                 )
                 return
 
+            self._game_summary = None
             ok = self.dispatcher.execute("delete_game")
 
             if ok:
+                self._active_game = False
                 self._show_message(
                     "Notification",
                     "Eliminación Completa",
@@ -479,7 +535,10 @@ class CLIHandler:
             if not scenarios_data:
                 return
             
-            if not self._confirm_probability_assignment_start():
+            if not self._confirm_enter_or_cancel(
+                self.formatter.show_cli_probability_assignment_intro,
+                "Se canceló la asignación de probabilidades."
+            ):
                 return
             
             if not self._process_all_scenarios(scenarios_data["scenarios"]):
@@ -505,27 +564,6 @@ class CLIHandler:
         
         return scenarios_data
 
-    def _confirm_probability_assignment_start(self) -> bool:
-        while True:
-            self.formatter.show_cli_probability_assignment_intro()
-            start_raw = self.parser.read_input("\n> ")
-
-            if self.parser.is_cancel(start_raw):
-                self._show_message(
-                    "Notification",
-                    "Cancelando operación",
-                    "Se canceló la asignación de probabilidades."
-                )
-                return False
-            if start_raw in (""):
-                return True
-            else:
-                self._show_message(
-                    "Notification",
-                    "Respuesta incorrecta",
-                    "Solo presione [Enter] o ingrese 'C'."
-                )
-
     def _process_all_scenarios(self, scenarios: List[List[str]]) -> bool:
         for idx, actions in enumerate(scenarios, start=1):
             if not self._process_single_scenario(idx, actions):
@@ -544,7 +582,7 @@ class CLIHandler:
                 continue 
             else:
                 if self._probabilities_in_range(probabilities):
-                    if self.technical_validator.is_numeric_in_range(sum(probabilities),1,1):
+                    if abs(math.fsum(probabilities) - 1.0) <= self._PROBABILITY_TOLERANCE:
                         if self._assign_scenario_probabilities(scenario_index, actions, probabilities):
                             self._show_probabilities_registered(scenario_index, actions, probabilities)
                             return True
@@ -563,14 +601,14 @@ class CLIHandler:
                     continue
 
     def _probabilities_in_range(self, probabilities: List[float]) -> bool:
-        for probability_value in probabilities:
-            if not self.technical_validator.is_numeric_in_range(probability_value,0,1):
-                self._show_message(
+        in_range = self.technical_validator.is_numeric_in_range
+        if not all(in_range(probability_value, 0, 1) for probability_value in probabilities):
+            self._show_message(
                 "Notification",
                 "Valores fuera de rango",
                 "Ingrese SOLO valores númericos entre el 1 y el 0."
-                )
-                return False
+            )
+            return False
         return True
     
     def _read_scenario_probabilities(self, scenario_index: int, actions: List[str]) -> Optional[List[float]]:
@@ -636,6 +674,7 @@ class CLIHandler:
 
     def _finalize_probability_assignment(self) -> None:
         try:
+            self._game_summary = None
             ok = self.dispatcher.execute("finalize_probability_assignment")
             
             if ok:
@@ -656,10 +695,19 @@ class CLIHandler:
     # ===========================================================   
     def _handle_generate_histories(self) -> None:
         try:
-            if not self._confirm_history_generation_start():
+            if not self._confirm_enter_or_cancel(
+                self.formatter.show_cli_history_generation_intro,
+                "Se canceló la generación de historias."
+            ):
                 return
             
-            result = self._process_history_generation()
+            self._game_summary = None
+            result = self._dispatch_or_error(
+                "generate_histories",
+                "Error en la generación de Historias",
+                "No se pudieron generar las historias del juego.",
+                pre_format=self.formatter.show_cli_history_processing
+            )
             if not result:
                 return
             
@@ -670,48 +718,6 @@ class CLIHandler:
         except Exception as error:
             self._handle_unexpected_error(error)
 
-    def _confirm_history_generation_start(self) -> bool:
-        while True:
-            self.formatter.show_cli_history_generation_intro()
-            start_raw = self.parser.read_input("\n> ")
-
-            if self.parser.is_cancel(start_raw):
-                self._show_message(
-                    "Notification",
-                    "Cancelando operación",
-                    "Se canceló la generación de historias."
-                )
-                return False
-            if start_raw in (""):
-                return True
-            else:
-                self._show_message(
-                    "Notification",
-                    "Respuesta incorrecta",
-                    "Solo presione [Enter] o ingrese 'C'."
-                )
-
-    def _process_history_generation(self) -> Optional[Dict[str, Any]]:
-        try:
-            self.formatter.show_cli_history_processing()
-            
-            histories_result = self.dispatcher.execute("generate_histories")
-            
-            if not histories_result:
-                self._show_message(
-                    "Error",
-                    "Error en la generación de Historias",
-                    f"{histories_result.get('error', 'Error desconocido')}"
-                )
-                return None
-            
-            return histories_result
-            
-        except GameException as error:
-            self._show_message("Error", error.technical_message,error.user_message)
-        except Exception as error:
-            self._handle_unexpected_error(error)
-
     def _show_history_generation_results(self) -> None:
         histories_samples_data = self.dispatcher.execute("get_histories_samples")
         histories_samples = histories_samples_data["samples"]
@@ -729,15 +735,28 @@ class CLIHandler:
     # ===========================================================  
     def _handle_calculate_utilities(self) -> None:
         try:
-            if not self._confirm_utilities_calculation_start():
+            if not self._confirm_enter_or_cancel(
+                self.formatter.show_cli_utility_intro,
+                "Se canceló el cálculo de utilidades."
+            ):
                 return
             
-            utility_result = self._process_utilities_calculation()
+            self._game_summary = None
+            utility_result = self._dispatch_or_error(
+                "calculate_utilities",
+                "Error en cálculo de utilidades",
+                "Verifique que todos los pasos anteriores se completaron correctamente.",
+                pre_format=self.formatter.show_cli_utility_processing
+            )
             if not utility_result:
                 return
             
             if self._ask_for_equilibria_calculation():
-                equilibria_result = self._process_equilibria_calculation()
+                equilibria_result = self._dispatch_or_error(
+                    "identify_equilibria",
+                    "Error en búsqueda de equilibrios",
+                    "Error durante la generación de los equilibrios"
+                )
             else:
                 equilibria_result = None
             
@@ -750,69 +769,6 @@ class CLIHandler:
         except Exception as error:
             self._handle_unexpected_error(error)
 
-    def _confirm_utilities_calculation_start(self) -> bool:
-        while True:
-            self.formatter.show_cli_utility_intro()
-            start_raw = self.parser.read_input("\n> ")
-
-            if self.parser.is_cancel(start_raw):
-                self._show_message(
-                    "Notification",
-                    "Cancelando operación",
-                    "Se canceló el cálculo de utilidades."
-                )
-                return False
-            if start_raw in (""):
-                return True
-            else:
-                self._show_message(
-                    "Notification",
-                    "Respuesta incorrecta",
-                    "Solo presione [Enter] o ingrese 'C'."
-                )
-
-    def _process_utilities_calculation(self) -> Optional[Dict[str, Any]]:
-        try:
-            self.formatter.show_cli_utility_processing()
-            
-            utility_result = self.dispatcher.execute("calculate_utilities")
-            
-            if not utility_result:
-                self._show_message(
-                    "Error",
-                    "Error en cálculo de utilidades",
-                    f"Verifique que todos los pasos anteriores se completaron correctamente."
-                )
-                return None
-            
-            return utility_result
-            
-        except GameException as error:
-            self._show_message("Error", error.technical_message,error.user_message)
-        except Exception as error:
-            self._handle_unexpected_error(error)
-
-    def _process_equilibria_calculation(self) -> Optional[Dict[str, Any]]:
-        try:
-            equilibria_result = self.dispatcher.execute("identify_equilibria")
-            
-            if not equilibria_result:
-                self._show_message(
-                    "Error",
-                    "Error en búsqueda de equilibrios",
-                    "Error durante la generación de los equilibrios"
-                )
-                return None
-            
-            return equilibria_result
-            
-        except GameException as error:
-            self._show_message("Error", error.technical_message,error.user_message)
-        except Exception as error:
-            self._handle_unexpected_error(error)
-
-
-
     def _show_utilities_results(self, utility_result: Dict[str, Any], 
                             equilibria_result: Optional[Dict[str, Any]]) -> None:
         utility_lines = utility_result.get("utility_lines", [])
@@ -827,16 +783,17 @@ class CLIHandler:
             )
         
         if equilibria_result:
-            eq_pages = equilibria_result.get("equilibria_pages", [])
-            total_eq = equilibria_result.get("total_equilibria", 0)
+            page_fetcher = equilibria_result.get("page_fetcher")
+            total_pages = equilibria_result.get("total_equilibria", 0)
             
-            if eq_pages and total_eq > 0:
+            if page_fetcher is not None and total_pages > 0:
                 current_index = 0
+                last_index = total_pages - 1
                 
                 while True:
-                    current_page = eq_pages[current_index]
+                    current_page = page_fetcher(current_index)
                     
-                    if total_eq == 1:
+                    if total_pages == 1:
                         self.formatter.show_cli_equilibria_single(current_page)
                         
                         self.parser.read_input("\n> ")
@@ -845,17 +802,17 @@ class CLIHandler:
                         self.formatter.show_cli_equilibria_with_navigation(
                             current_page, 
                             current_index + 1, 
-                            total_eq
+                            total_pages
                         )
                         
                         key = self.parser.read_input("\n> ").strip().lower()
                         
                         if key == '':  # Enter
                             return
-                        elif key == 'd' and current_index < total_eq - 1:
-                            current_index += 1
-                        elif key == 'a' and current_index > 0:
-                            current_index -= 1
+                        
+                        step = self._SPE_NAVIGATION.get(key)
+                        if step is not None and 0 <= current_index + step <= last_index:
+                            current_index += step
                         else:
                             self._show_message(
                                 "Notification",
@@ -874,6 +831,7 @@ class CLIHandler:
 
     def _finalize_utilities_calculation(self) -> None:
         try:
+            self._game_summary = None
             result = self.dispatcher.execute("finalize_utilities_calculation")
             
             if not result:
@@ -905,8 +863,7 @@ class CLIHandler:
 
     def _handle_export_results(self) -> None:
         try:
-            game_summary = self.dispatcher.execute("get_game_summary")
-            if not game_summary["has_active_game"]:
+            if not self._active_game:
                 raise NoActiveGameError()
 
             while True:
@@ -915,14 +872,12 @@ class CLIHandler:
                     raw_input = self.parser.read_input("> ")
                     option = self.parser.parse_menu_option(raw_input)
 
-                    if option == 1:
-                        self._handle_export_excel()
-                    elif option == 2:
-                        self._handle_show_tree("exportación")
-                    elif option == 3:
-                        self._handle_export_both()
-                    elif option == 4:
-                        return
+                    if option == 4:
+                        return  # Menú principal
+
+                    handler = self._export_menu_routes.get(option)
+                    if handler is not None:
+                        handler()
                     else:
                         self._show_message(
                             "Notification",
@@ -945,14 +900,10 @@ class CLIHandler:
         try:
             confirm = self._ask_yes_no_question("¿Desea exportar todos los resultados del juego a un archivo Excel? (S/N)")
             if not confirm:
-                self._show_message(
-                    "Notification",
-                    "Exportación Cancelada",
-                    "Se canceló la operación de exportación."
-                )
+                self._show_export_cancelled()
                 return
 
-            self._show_message(
+            self.formatter.display_message(
                 "Notification",
                 "Exportando resultados...",
                 "Por favor espere mientras se generan los archivos."
@@ -964,17 +915,10 @@ class CLIHandler:
                 self.formatter.show_cli_export_preview_simple(result.get("file_path", ""))
                 self.parser.read_input("\n> ")
             else:
-                error_msg = result.get("error", "Error desconocido")
-                self._show_message(
-                    "Error",
-                    "Error en exportación",
-                    f"No se pudieron exportar los resultados: {error_msg}"
-                )
+                self._show_export_failure(result)
                 
-        except GameException as error:
-            self._show_message("Error", error.technical_message,error.user_message)
         except Exception as error:
-            self._handle_unexpected_error(error)
+            self._handle_export_error(error)
 
     def _handle_export_both(self) -> None:
         try:
@@ -983,11 +927,7 @@ class CLIHandler:
             )
             
             if not confirm:
-                self._show_message(
-                    "Notification",
-                    "Exportación Cancelada",
-                    "Se canceló la operación de exportación."
-                )
+                self._show_export_cancelled()
                 return
 
             self.formatter.display_message("Notification", "Exportando resultados combinados...",
@@ -1005,19 +945,38 @@ class CLIHandler:
                 self.logger.log_warning(f"No se pudo exportar el árbol: {tree_error}")
 
             excel_file = excel_result.get("file_path", "")
-            excel_name = excel_file.split("/")[-1] if "/" in excel_file else excel_file
+            excel_name = basename(excel_file)
             
             if tree_path:
-                tree_name = tree_path.split("/")[-1] if "/" in tree_path else tree_path
+                tree_name = basename(tree_path)
                 self.formatter.show_cli_combined_export_success(excel_name, tree_name)
             else:
                 self.formatter.show_cli_export_preview_simple(excel_file)
             
             self.parser.read_input("\n> ")
             
-        except GameException as error:
-            self._show_message("Error", error.technical_message,error.user_message)
         except Exception as error:
+            self._handle_export_error(error)
+
+    def _show_export_cancelled(self) -> None:
+        self._show_message(
+            "Notification",
+            "Exportación Cancelada",
+            "Se canceló la operación de exportación."
+        )
+
+    def _show_export_failure(self, result: Dict[str, Any]) -> None:
+        error_msg = result.get("error", "Error desconocido")
+        self._show_message(
+            "Error",
+            "Error en exportación",
+            f"No se pudieron exportar los resultados: {error_msg}"
+        )
+
+    def _handle_export_error(self, error: Exception) -> None:
+        if isinstance(error, GameException):
+            self._show_message("Error", error.technical_message, error.user_message)
+        else:
             self._handle_unexpected_error(error)
 
 
@@ -1040,8 +999,7 @@ class CLIHandler:
             return False
 
     def _ask_to_configure_order(self, player_order: List[int], context: str = None) -> bool:
-        current_order = [f"J{player_id}" for player_id in player_order]
-        order_str = " -> ".join(current_order)
+        order_str = _render_order(tuple(player_order))
         
         configure_order = self._ask_yes_no_question(
             f"Orden automático asignado (cíclico):\n{order_str}\n"
@@ -1070,18 +1028,61 @@ class CLIHandler:
     def _ask_yes_no_question(self, question: str) -> bool:
         while True:
             self.formatter.display_message("Question", "", question)
-            answer = self.parser.read_input("\n> ").strip().lower()
-            if answer in ("n", "no"):
+            answer = self._YESNO_MAP.get(self.parser.read_input("\n> ").strip().lower())
+            if answer is not None:
+                return answer
+
+            self._show_message(
+                "Notification",
+                "Respuesta incorrecta",
+                "Solo responda 'S' o 'N'."
+            )
+    
+    def _confirm_enter_or_cancel(self, intro_fn: callable, cancel_msg: str) -> bool:
+        read_input = self.parser.read_input
+        is_cancel = self.parser.is_cancel
+        show_message = self._show_message
+
+        while True:
+            intro_fn()
+            start_raw = read_input("\n> ").strip()
+
+            if is_cancel(start_raw):
+                show_message("Notification", "Cancelando operación", cancel_msg)
                 return False
-            elif answer in ("s", "si"):
+            if start_raw == "":
                 return True
-            else:
-                self._show_message(
-                    "Notification",
-                    "Respuesta incorrecta",
-                    "Solo responda 'S' o 'N'."
-                )
-    
+            show_message(
+                "Notification",
+                "Respuesta incorrecta",
+                "Solo presione [Enter] o ingrese 'C'."
+            )
+
+    def _dispatch_or_error(
+        self,
+        command: str,
+        error_title: str,
+        error_message: str,
+        pre_format: Optional[callable] = None
+    ) -> Optional[Dict[str, Any]]:
+        try:
+            if pre_format is not None:
+                pre_format()
+
+            result = self.dispatcher.execute(command)
+
+            if not result:
+                self._show_message("Error", error_title, error_message)
+                return None
+
+            return result
+
+        except GameException as error:
+            self._show_message("Error", error.technical_message, error.user_message)
+        except Exception as error:
+            self._handle_unexpected_error(error)
+        return None
+
     def _show_message(self, message_type: str, title: str, message: str) -> None:
         self.formatter.display_message(message_type, title, message)
         self.parser.read_input("\n> ")
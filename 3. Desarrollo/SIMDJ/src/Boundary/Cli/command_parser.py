@@ -10,6 +10,10 @@ class ParsedCommand:
 
 
 class CommandParser:
+    _CANCEL = frozenset({"C", "c"})
+    _YES = frozenset({"S", "s"})
+    _NO = frozenset({"N", "n"})
+
     def read_input(self, prompt: str = "> ") -> str:
         return input(prompt)
 
@@ -29,19 +33,29 @@ class CommandParser:
         if not raw:
             return None
         try:
-            parts = [p.strip() for p in raw.split(",")]
+            return list(map(float, raw.split(",")))
+        except ValueError:
+            return None
+
+    def parse_payoffs_row(self, raw: str, expected_len: int) -> Optional[List[float]]:
+        raw = raw or ""
+        # Separador coma (o espacios si no hay comas); un campo vacío invalida la fila
+        parts = [part.strip() for part in raw.split(",")] if "," in raw else raw.split()
+        if len(parts) != expected_len or not all(parts):
+            return None
+        try:
             return [float(p) for p in parts]
         except ValueError:
             return None
 
     def is_cancel(self, raw: str) -> bool:
-        return (raw or "").strip().upper() == "C"
+        return raw is not None and raw.strip() in self._CANCEL
 
     def is_yes(self, raw: str) -> bool:
-        return (raw or "").strip().upper() == "S"
+        return raw is not None and raw.strip() in self._YES
 
     def is_no(self, raw: str) -> bool:
-        return (raw or "").strip().upper() == "N"
+        return raw is not None and raw.strip() in self._NO
 
 
 __all__ = ["CommandParser", "ParsedCommand"]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Dict, Callable, Any
+from types import MappingProxyType
+from typing import ClassVar, Callable, Any, FrozenSet, Mapping, Tuple
 
 from .game_controller import GameController
 from Infrastructure.Common.logger import Logger
@@ -16,64 +17,73 @@ class CommandDispatcher:
     technical_validator: TechnicalValidator
     game_controller: GameController
     
-    routes: Dict[str, Callable[..., Any]] = None
+    QUERY_COMMANDS: ClassVar[FrozenSet[str]] = frozenset({
+        "has_active_game",
+        "get_game_summary",
+        "get_player_order_preview",
+        "get_players_for_order",
+        "get_scenarios_for_probability_assignment",
+        "get_histories_samples",
+    })
+
+    _ROUTE_NAMES: ClassVar[Tuple[Tuple[str, str], ...]] = (
+        # ===========================================================
+        # CU-01 — Crear Juego y Registrar Payoffs
+        # ===========================================================
+        ("create_game", "create_game"),
+        ("register_payoffs", "register_payoffs"),
+        ("has_active_game", "has_active_game"),
+        ("get_game_summary", "get_game_summary"),
+        ("get_player_order_preview", "get_player_order_preview"),
+
+        # ===========================================================
+        # CU-02 — Configurar Orden y Gestión del Juego
+        # ===========================================================
+        ("configure_order", "configure_order"),
+        ("delete_game", "delete_game"),
+        ("get_players_for_order", "get_players_for_order"),
+
+        # ===========================================================
+        # CU-03 — Visualizar Árbol
+        # ===========================================================
+        ("show_tree", "show_tree"),
+
+        # ===========================================================
+        # CU-04 — Asignar Probabilidades
+        # ===========================================================
+        ("assign_prob", "assign_probabilities"),
+        ("normalize_prob", "normalize_probabilities"),
+        ("get_scenarios_for_probability_assignment", "get_scenarios_for_probability_assignment"),
+        ("save_probabilities_summary", "save_probabilities_summary"),
+        ("finalize_probability_assignment", "finalize_probability_assignment"),
+        ("update_game_state", "update_game_state"),
+
+        # ===========================================================
+        # CU-05 — Generar Historias
+        # ===========================================================
+        ("generate_histories", "generate_histories"),
+        ("get_histories_samples", "get_histories_samples"),
+
+        # ===========================================================
+        # CU-06 — Calcular Utilidades y Equilibrios
+        # ===========================================================
+        ("calculate_utilities", "calculate_utilities"),
+        ("identify_equilibria", "identify_equilibria"),
+        ("finalize_utilities_calculation", "finalize_utilities_calculation"),
+
+        # ===========================================================
+        # CU-07 — Exportar Datos
+        # ===========================================================
+        ("export_complete_results", "export_complete_results"),
+    )
+
+    routes: Mapping[str, Callable[..., Any]] = None
 
     def __post_init__(self) -> None:
-
-        self.routes = {
-            # ===========================================================
-            # CU-01 — Crear Juego y Registrar Payoffs
-            # ===========================================================
-            "create_game": self.game_controller.create_game,
-            "register_payoffs": self.game_controller.register_payoffs,
-            "get_game_summary": self.game_controller.get_game_summary,
-            "get_player_order_preview": self.game_controller.get_player_order_preview,
-
-            # ===========================================================
-            # CU-02 — Configurar Orden y Gestión del Juego
-            # ===========================================================
-            "configure_order": self.game_controller.configure_order,
-            "delete_game": self.game_controller.delete_game,
-            "get_players_for_order": self.game_controller.get_players_for_order,
-            
-            # ===========================================================
-            # CU-03 — Visualizar Árbol
-            # ===========================================================
-            "show_tree": self.game_controller.show_tree,
-
-            # ===========================================================
-            # CU-04 — Asignar Probabilidades
-            # ===========================================================
-            "assign_prob": self.game_controller.assign_probabilities,
-            "normalize_prob": self.game_controller.normalize_probabilities,
-            "get_scenarios_for_probability_assignment": (
-                self.game_controller.get_scenarios_for_probability_assignment
-            ),
-            "save_probabilities_summary": self.game_controller.save_probabilities_summary,
-            "finalize_probability_assignment": self.game_controller.finalize_probability_assignment,
-            "update_game_state": self.game_controller.update_game_state,
-
-            # ===========================================================
-            # CU-05 — Generar Historias
-            # ===========================================================
-            "generate_histories": self.game_controller.generate_histories,
-            "get_histories_samples": self.game_controller.get_histories_samples,
-
-
-            # ===========================================================
-            # CU-06 — Calcular Utilidades y Equilibrios
-            # ===========================================================
-            "calculate_utilities": self.game_controller.calculate_utilities,
-            "identify_equilibria": self.game_controller.identify_equilibria,
-            "finalize_utilities_calculation": self.game_controller.finalize_utilities_calculation,
-
-            # ===========================================================
-            # CU-07 — Exportar Datos
-            # ===========================================================
-            "export_complete_results": self.game_controller.export_complete_results,
-
-
-        }
+        self.routes = MappingProxyType({
+            command: getattr(self.game_controller, attribute)
+            for command, attribute in self._ROUTE_NAMES
+        })
 
     def execute(self, command: str, *args, **kwargs) -> Any:
         handler = self.routes.get(command)
@@ -84,6 +94,9 @@ class CommandDispatcher:
             raise ValueError(error_message)
         
         try:
+            if command in self.QUERY_COMMANDS:
+                return handler(*args, **kwargs)
+
             self.logger.log_info(f"Ejecutando comando: {command}")
             result = handler(*args, **kwargs)
             self.logger.log_info(f"Comando '{command}' ejecutado exitosamente")
@@ -1,6 +1,9 @@
 from __future__ import annotations
-from typing import Any, List, Optional, Dict, Sequence
+from typing import Any, List, Optional, Dict, Sequence, Tuple, Union
 from datetime import datetime
+from functools import lru_cache
+from itertools import count, cycle, islice, product
+import operator
 
 
 from Control.App.session_manager import SessionManager
@@ -64,46 +67,51 @@ class GameController:
         self._last_equilibria: List[Strategy] = []
         
         self._matrix_state: Dict[int, Dict[str, int]] = {}
+        self._action_map_cache: Optional[Tuple[Game, int, Dict[str, Action]]] = None
+        self._decision_scenarios_cache: Optional[Tuple[Game, int, List[Scenario]]] = None
+        self._assigned_payoffs_key: Optional[Tuple[Any, ...]] = None
         self._matrix_rows_per_page: int = 10
         self._matrix_cols_per_page: int = 6
 
         if not self.session.has_active_game():
             self.session.initialize_session()
 
+    #Listo  - Auxiliar
+    def has_active_game(self) -> bool:
+        return self.session.has_active_game()
+
     #Listo  - Auxiliar
     def get_game_summary(self) -> Dict[str, Any]:
-        if not self.session.has_active_game():
+        session = self.session
+        game = session.active_game
+        if game is None:
             return {"has_active_game": False}
         
-        session_summary = self.session.get_summary()
-        player_order_ids = []
-
-        for player in self.session.player_order:
-            if hasattr(player, 'player_id'):
-                player_order_ids.append(player.player_id)
-            elif isinstance(player, (int, str)):
-                player_order_ids.append(int(player))
-            else:
-                player_order_ids.append(len(player_order_ids) + 1)
+        player_order_ids = [player.player_id for player in session.player_order]
         
+        total_payoffs = len(session.payoffs)
+        utility_matrix = session.utility_matrix
+        total_utilities = len(utility_matrix)
+        total_histories_generated = len(session.history_list)
+
         return {
             "has_active_game": True,
             "config": {
-                "players": self.session.num_players,
-                "rounds": self.session.num_rounds,
-                "strategies": self.session.num_strategies
+                "players": session.num_players,
+                "rounds": session.num_rounds,
+                "strategies": session.num_strategies
             },
             "player_order": player_order_ids,
-            "total_histories": self.session.total_histories,
-            "game_state": session_summary["active_game_state"],
-            "created_at": self.session.created_at,
-            "total_payoffs": len(self.session.payoffs),
-            "has_payoffs": len(self.session.payoffs) > 0,
-            "has_utilities": len(self.session.utility_matrix) > 0,
-            "utility_shape": session_summary.get("utility_shape", (0, 0)),
-            "total_utilities": len(self.session.utility_matrix),
-            "total_histories_generated": len(self.session.history_list),
-            "has_histories": len(self.session.history_list) > 0
+            "total_histories": session.total_histories,
+            "game_state": game.state.value,
+            "created_at": session.created_at,
+            "total_payoffs": total_payoffs,
+            "has_payoffs": total_payoffs > 0,
+            "has_utilities": total_utilities > 0,
+            "utility_shape": (total_utilities, len(utility_matrix[0]) if utility_matrix else 0),
+            "total_utilities": total_utilities,
+            "total_histories_generated": total_histories_generated,
+            "has_histories": total_histories_generated > 0
         }
 
     def create_game(self, num_players: int, num_rounds: int, num_strategies: int) -> bool:
@@ -146,10 +154,11 @@ class GameController:
             self.logger.log_warning(f"[CU-01] Validación falló: {error.technical_message}")
             raise
         except Exception as error:
-            self.logger.log_error(f"[CU-01] Error inesperado: {error}")
-            raise OperationError(
-                technical_message=f"Error técnico durante la creación del juego: {error}",
-                user_message="Error durante la creación del JUEGO. Intente nuevamente."
+            raise self._operation_error(
+                error,
+                "[CU-01] Error inesperado",
+                "Error técnico durante la creación del juego",
+                "Error durante la creación del JUEGO. Intente nuevamente."
             )
 
     def register_payoffs(self, payoffs_matrix: List[List[float]]) -> Dict[str, Any]:
@@ -157,8 +166,6 @@ class GameController:
             game = self._validate_active_game()
                 
             players = game.players
-            payoffs_objects = []
-            payoff_id = 1
 
             temp_histories = []
             for history_idx in range(len(payoffs_matrix)):
@@ -170,30 +177,26 @@ class GameController:
                 )
                 temp_histories.append(temp_history)
 
-            for history_idx, payoff_vector in enumerate(payoffs_matrix):
-                for player_idx, payoff_value in enumerate(payoff_vector):
-                    if player_idx < len(players):
-                        payoff = Payoff(
-                            payoff_id=payoff_id,
-                            player=players[player_idx],
-                            history=temp_histories[history_idx],
-                            value=payoff_value
-                        )
-                        payoffs_objects.append(payoff)
-                        payoff_id += 1
-
+            next_payoff_id = count(1).__next__
+            payoffs_objects = [
+                Payoff(payoff_id=next_payoff_id(), player=player, history=history, value=payoff_value)
+                for history, payoff_vector in zip(temp_histories, payoffs_matrix)
+                for player, payoff_value in zip(players, payoff_vector)
+            ]
 
             self.session.save_payoffs(payoffs_objects)
             self.session.save_temp_histories(temp_histories)
-            game.payoffs = list(payoffs_objects)
+            game.payoffs = payoffs_objects
             
-            for history in temp_histories:
-                if history not in game.histories:
-                    game.histories.append(history)
+            # game.histories puede ser la lista de la sesión; se reasigna en lugar de extenderla
+            existing_histories = set(game.histories)
+            game.histories = game.histories + [
+                history for history in temp_histories if history not in existing_histories
+            ]
             
             preview = self._generate_payoffs_preview(payoffs_matrix)
             
-            self.logger.log_info(f"[CU-01] {len(payoffs_objects)} payoffs registrados exitosamente")
+            self.logger.log_info("[CU-01] %d payoffs registrados exitosamente", len(payoffs_objects))
             
             return {
                 "success": True, 
@@ -204,33 +207,34 @@ class GameController:
             self.logger.log_warning(f"[CU-01] Validación falló: {error.technical_message}")
             raise
         except Exception as error:
-            self.logger.log_error(f"[CU-01] Error inesperado: {error}")
-            raise OperationError(
-                technical_message=f"Error registrando payoffs: {error}",
-                user_message="No se pudieron registrar correctamente los pagos."
+            raise self._operation_error(
+                error,
+                "[CU-01] Error inesperado",
+                "Error registrando payoffs",
+                "No se pudieron registrar correctamente los pagos."
             )
 
     #Listo  - Auxiliar
     def _generate_payoffs_preview(self, payoffs_matrix: List[List[float]]) -> str:
-        preview_lines = []
-        for idx, payoff_vector in enumerate(payoffs_matrix, start=1):
-            payoffs_str = ', '.join([
-                f'|J{j+1}-[ {value}]|' for j, value in enumerate(payoff_vector)
-            ])
-            preview_lines.append(f"Historia {idx}: {payoffs_str}")
-        return "\n".join(preview_lines)
+        if not payoffs_matrix:
+            return ""
+
+        cell_templates = [
+            f"|J{j}-[ {{}}]|" for j in range(1, len(payoffs_matrix[0]) + 1)
+        ]
+        return "\n".join(
+            f"Historia {idx}: " + ', '.join(map(str.format, cell_templates, payoff_vector))
+            for idx, payoff_vector in enumerate(payoffs_matrix, start=1)
+        )
     
     #Listo  - Auxiliar
     def _generate_cyclic_player_order(self, players: List[Player], rounds: int) -> List[Player]:
-        return [players[round_num % len(players)] for round_num in range(rounds)]
+        return list(islice(cycle(players), rounds))
 
     #Listo  - Auxiliar
     def get_player_order_preview(self, players: int, rounds: int) -> List[str]:
-        order = []
-        for round_num in range(rounds):
-            player_id = (round_num % players) + 1
-            order.append(f"J{player_id}")
-        return order
+        labels = [f"J{player_id}" for player_id in range(1, players + 1)]
+        return list(islice(cycle(labels), rounds))
 
     def configure_order(self, player_ids: List[int]) -> bool:  
         try:
@@ -249,26 +253,22 @@ class GameController:
             
             self.session.set_player_order(player_objects)
             
-            rounds = game.rounds
-            for round_index, game_round in enumerate(rounds):
-                if round_index < len(player_objects):
-                    game_round.active_player = player_objects[round_index]
-                else:
-                    player_index = round_index % len(player_objects)
-                    game_round.active_player = player_objects[player_index]
+            for game_round, player in zip(game.rounds, cycle(player_objects)):
+                game_round.active_player = player
             
             game.state = GameState.CREATED
-            self.logger.log_info(f"[CU-02] Orden configurado: {player_ids}")
+            self.logger.log_info("[CU-02] Orden configurado: %s", player_ids)
             return True
             
         except GameException as error:
             self.logger.log_warning(f"[CU-02] Error durante la configuración del orden de jugadores: {error.technical_message}")
             raise
         except Exception as error:
-            self.logger.log_error(f"[CU-02] Error inesperado: {error}")
-            raise OperationError(
-                technical_message=f"Error durante la configuración del orden: {error}",
-                user_message="Error durante la actualización del orden de los Jugadores."
+            raise self._operation_error(
+                error,
+                "[CU-02] Error inesperado",
+                "Error durante la configuración del orden",
+                "Error durante la actualización del orden de los Jugadores."
             )
         
     #Listo  - Auxiliar
@@ -279,13 +279,27 @@ class GameController:
             return {"players_list": []}
         
         players = game.players
-        players_list = [f"J{player.player_id}" for player in players]
+        players_list = [player.label for player in players]
 
         return {
             "players_list": players_list,
             "total_players": len(players)
         }
 
+    #Listo - Auxiliar
+    def _operation_error(
+        self,
+        error: Exception,
+        log_context: str,
+        technical_context: str,
+        user_message: str
+    ) -> OperationError:
+        self.logger.log_error("%s: %s", log_context, error)
+        return OperationError(
+            technical_message=f"{technical_context}: {error}",
+            user_message=user_message
+        )
+
     #Listo - Auxiliar
     def _validate_active_game(self) -> Game:
         game = self.session.get_active_game()
@@ -306,10 +320,11 @@ class GameController:
             self.logger.log_warning(f"[CU-02] Error durante la eliminación del juego: {error.technical_message}")
             raise
         except Exception as error:
-            self.logger.log_error(f"[CU-02] Error inesperado durante la eliminación del juego: {error}")
-            raise OperationError(
-                technical_message=f"Error durante la eliminación del juego: {error}",
-                user_message="Error durante la eliminación del JUEGO."
+            raise self._operation_error(
+                error,
+                "[CU-02] Error inesperado durante la eliminación del juego",
+                "Error durante la eliminación del juego",
+                "Error durante la eliminación del JUEGO."
             )
 
     def show_tree(self) -> str:
@@ -327,11 +342,12 @@ class GameController:
             self.logger.log_warning(f"[CU-03] Error durante la exportación del SVG de Árbol: {error.technical_message}")
             raise
         except Exception as error:
-            self.logger.log_error(f"[CU-03] Error inesperado durante la exportación del SVG de Árbol: {error}")
-            raise OperationError(
-                technical_message=f"Error durante la exportación del SVG de Árbol: {error}",
-                user_message="Error durante la la exportación del SVG de Árbol."
-            )        
+            raise self._operation_error(
+                error,
+                "[CU-03] Error inesperado durante la exportación del SVG de Árbol",
+                "Error durante la exportación del SVG de Árbol",
+                "Error durante la la exportación del SVG de Árbol."
+            )
 
     def assign_probabilities(self, scenario_index: int, action_labels: List[str], 
                             values: List[float]) -> bool:
@@ -349,18 +365,19 @@ class GameController:
             if not self.probability_assigner.validate_probabilities(scenario):
                 raise ValueError("Probabilidades inválidas para el escenario")
             
-            self.logger.log_info(f"[CU-04] Probabilidades asignadas: asignadasal escenario {scenario_index}: {values}")
+            self.logger.log_info("[CU-04] Probabilidades asignadas: asignadasal escenario %s: %s", scenario_index, values)
             return True
             
         except GameException as error:
             self.logger.log_warning(f"[CU-04] Error asignando probabilidades: {error.technical_message}")
             raise
         except Exception as error:
-            self.logger.log_error(f"[CU-04] Error inesperado durante la asignación de probabilidades: {error}")
-            raise OperationError(
-                technical_message=f"Error asignando probabilidades: {error}",
-                user_message="Error durante la asignación de probabilidades."
-            )   
+            raise self._operation_error(
+                error,
+                "[CU-04] Error inesperado durante la asignación de probabilidades",
+                "Error asignando probabilidades",
+                "Error durante la asignación de probabilidades."
+            )
 
     def normalize_probabilities(self, action_labels: List[str], values: List[float]) -> List[float]:
         try:
@@ -372,35 +389,34 @@ class GameController:
                 raise ValueError("Número de acciones y valores no coinciden")
                     
             self.probability_assigner.assign_probabilities(actions, values)
-            self.probability_assigner.normalize_probabilities(actions)
+            normalized_probabilities = self.probability_assigner.normalize_probabilities(actions)
             
-            normalized_probabilities = [
-                self.probability_assigner.get_probability(action) 
-                for action in actions
-            ]
-            
-            self.logger.log_info(f"[CU-04] Probabilidades normalizadas: {normalized_probabilities}")
+            self.logger.log_info("[CU-04] Probabilidades normalizadas: %s", normalized_probabilities)
             return normalized_probabilities
     
         except GameException as error:
             self.logger.log_warning(f"[CU-04] Error normalizando probabilidades: {error.technical_message}")
             raise
         except Exception as error:
-            self.logger.log_error(f"[CU-04] Error inesperado durante la normalización de probabilidades: {error}")
-            raise OperationError(
-                technical_message=f"Error anormalizando probabilidades: {error}",
-                user_message="Error durante la normalización de probabilidades."
-            )   
+            raise self._operation_error(
+                error,
+                "[CU-04] Error inesperado durante la normalización de probabilidades",
+                "Error anormalizando probabilidades",
+                "Error durante la normalización de probabilidades."
+            )
 
     def get_scenarios_for_probability_assignment(self) -> Dict[str, Any]:
         try:
             game = self._validate_active_game()
             
-            scenarios_data = []
-            for scenario in game.scenarios:
-                if scenario.outgoing_actions:
-                    action_labels = [action.label for action in scenario.outgoing_actions]
-                    scenarios_data.append(action_labels)
+            decision_scenarios = self._get_decision_scenarios(game)
+            if not decision_scenarios:
+                return {"has_scenarios": False, "scenarios": [], "total_scenarios": 0}
+
+            scenarios_data = [
+                [action.label for action in scenario.outgoing_actions]
+                for scenario in decision_scenarios
+            ]
             
             return {
                 "has_scenarios": len(scenarios_data) > 0,
@@ -412,18 +428,19 @@ class GameController:
             self.logger.log_warning(f"[CU-04] Error obteniendo escenarios: {error.technical_message}")
             raise
         except Exception as error:
-            self.logger.log_error(f"[CU-04] Error inesperado durante la obtención de escenarios: {error}")
-            raise OperationError(
-                technical_message=f"Error anormalizando probabilidades: {error}",
-                user_message="Error durante la obtención de escenarios."
-            )  
+            raise self._operation_error(
+                error,
+                "[CU-04] Error inesperado durante la obtención de escenarios",
+                "Error anormalizando probabilidades",
+                "Error durante la obtención de escenarios."
+            )
 
     def save_probabilities_summary(self) -> bool:
         try:
             game = self._validate_active_game()
             
             summary = self.probability_assigner.get_probabilities_summary(game)
-            self.session.save_probabilities(summary)
+            self.session.save_probabilities(summary, copy=False)
             
             self.logger.log_info("[CU-04] Resumen de probabilidades guardado")
             return True
@@ -432,39 +449,56 @@ class GameController:
             self.logger.log_warning(f"[CU-04] Error guardando resumen de probabilidades: {error.technical_message}")
             raise
         except Exception as error:
-            self.logger.log_error(f"[CU-04] Error inesperado durante el guardado del resumen de probabilidades: {error}")
-            raise OperationError(
-                technical_message=f"Error anormalizando probabilidades: {error}",
-                user_message="Error durante el guardado del resumen de probabilidades."
-            )  
+            raise self._operation_error(
+                error,
+                "[CU-04] Error inesperado durante el guardado del resumen de probabilidades",
+                "Error anormalizando probabilidades",
+                "Error durante el guardado del resumen de probabilidades."
+            )
 
     def _get_actions_by_labels(self, game: Game, action_labels: List[str]) -> List[Action]:
-        action_map = {action.label: action for action in game.actions}
+        action_map = self._get_action_map(game)
         
-        actions = []
         for label in action_labels:
             if label not in action_map:
                 raise MissingValueError(f"Acción '{label}' no encontrada en el juego")
-            actions.append(action_map[label])
         
-        return actions
+        return [action_map[label] for label in action_labels]
+
+    def _get_action_map(self, game: Game) -> Dict[str, Action]:
+        cached = self._action_map_cache
+        if cached is not None and cached[0] is game and cached[1] == len(game.actions):
+            return cached[2]
+
+        action_map = {action.label: action for action in game.actions}
+        self._action_map_cache = (game, len(game.actions), action_map)
+        return action_map
 
     def _get_scenario_by_index(self, game: Game, scenario_index: int) -> Scenario:
-        scenarios_with_actions = [
-            scenario for scenario in game.scenarios 
-            if scenario.outgoing_actions
-        ]
+        scenarios_with_actions = self._get_decision_scenarios(game)
         
         if not (1 <= scenario_index <= len(scenarios_with_actions)):
             raise ValueError(f"Índice de escenario inválido: {scenario_index}")
         
         return scenarios_with_actions[scenario_index - 1]
 
-    def update_game_state(self, state_str: str) -> bool:
+    def _get_decision_scenarios(self, game: Game) -> List[Scenario]:
+        cached = self._decision_scenarios_cache
+        if cached is not None and cached[0] is game and cached[1] == len(game.scenarios):
+            return cached[2]
+
+        scenarios_with_actions = [
+            scenario for scenario in game.scenarios 
+            if scenario.outgoing_actions
+        ]
+        self._decision_scenarios_cache = (game, len(game.scenarios), scenarios_with_actions)
+        return scenarios_with_actions
+
+    def update_game_state(self, state_str: Union[str, GameState]) -> bool:
         try:
-            game_state = GameState[state_str.upper()]
+            game_state = state_str if isinstance(state_str, GameState) else GameState[state_str.upper()]
             self.session.update_game_state(game_state)
-            self.logger.log_info(f"Estado del juego actualizado a: {game_state.value}")
+            self.logger.log_info("Estado del juego actualizado a: %s", game_state.value)
             return True
         
         except KeyError:
@@ -482,7 +516,7 @@ class GameController:
                 raise GameException("No se pudieron guardar las probabilidades.")
             
             # 2. Actualizar estado del juego a RUNNING
-            update_ok = self.update_game_state("RUNNING")
+            update_ok = self.update_game_state(GameState.RUNNING)
             if not update_ok:
                 raise GameException("No se pudo actualizar el estado del juego.")
 
@@ -492,11 +526,12 @@ class GameController:
             self.logger.log_warning(f"[CU-04] Error guardando resumen de probabilidades: {error.technical_message}")
             raise
         except Exception as error:
-            self.logger.log_error(f"[CU-04] Error inesperado durante el guardado del resumen de probabilidades: {error}")
-            raise OperationError(
-                technical_message=f"Error anormalizando probabilidades: {error}",
-                user_message="Error durante el guardado del resumen de probabilidades."
-            )  
+            raise self._operation_error(
+                error,
+                "[CU-04] Error inesperado durante el guardado del resumen de probabilidades",
+                "Error anormalizando probabilidades",
+                "Error durante el guardado del resumen de probabilidades."
+            )
 
     # ==========================================================
     # CU-05 — GENERAR HISTORIAS
@@ -510,12 +545,11 @@ class GameController:
             
             histories = self.history_generator.generate_histories(game)
 
-            self.session.save_histories(histories)
-            game.histories = list(histories)
+            game.histories = self.session.save_histories(histories)
             
-            self._assign_histories_to_payoffs()
+            self._assign_histories_to_payoffs(game)
 
-            self.logger.log_info(f"[CU-05] {len(histories)} historias generadas correctamente")
+            self.logger.log_info("[CU-05] %d historias generadas correctamente", len(histories))
             return {
                 "success": True, 
                 "total_histories": len(histories),
@@ -526,11 +560,12 @@ class GameController:
             self.logger.log_warning(f"[CU-05] Error generando historias: {error.technical_message}")
             raise
         except Exception as error:
-            self.logger.log_error(f"[CU-05] Error inesperado durante la generación de historias: {error}")
-            raise OperationError(
-                technical_message=f"Error generando historias: {error}",
-                user_message="Error durante el generar las historias."
-            )         
+            raise self._operation_error(
+                error,
+                "[CU-05] Error inesperado durante la generación de historias",
+                "Error generando historias",
+                "Error durante el generar las historias."
+            )
 
     #Listo
     def get_histories_samples(self) -> Dict[str, Any]:
@@ -553,18 +588,19 @@ class GameController:
             self.logger.log_warning(f"[CU-05] Error al generar una muestra de las historias generadas: {error.technical_message}")
             raise
         except Exception as error:
-            self.logger.log_error(f"[CU-05] Error inesperado durante la generación de la muestra de historias generadas: {error}")
-            raise OperationError(
-                technical_message=f"Error al generar una muestra de las historias: {error}",
-                user_message="Error durante la generación de la muestra de historias generadas."
-            ) 
+            raise self._operation_error(
+                error,
+                "[CU-05] Error inesperado durante la generación de la muestra de historias generadas",
+                "Error al generar una muestra de las historias",
+                "Error durante la generación de la muestra de historias generadas."
+            )
 
     #Listo - Ojo, recuerda checar lo de las validaciones
     def _validate_game_state_for_histories(self, game: Game) -> None:
         if game.state != GameState.RUNNING:
             raise ValueError("El juego no está en estado RUNNING")
 
-    def _assign_histories_to_payoffs(self) -> bool:
+    def _assign_histories_to_payoffs(self, game: Game) -> bool:
         try:
             histories = self.session.history_list
             payoffs = self.session.payoffs
@@ -575,6 +611,12 @@ class GameController:
             if not payoffs:
                 self.logger.log_info("No hay payoffs para asignar historias")
                 raise MissingValueError("No hay payoffs para asignar historias")
+
+            # Las listas de la sesión se reasignan al guardarse, así que su identidad basta
+            assignment_key = (game, histories, payoffs, self.session.player_order)
+            last_key = self._assigned_payoffs_key
+            if last_key is not None and all(map(operator.is_, assignment_key, last_key)):
+                return True
                     
             unique_player_count = self.session.num_players
             
@@ -604,21 +646,19 @@ class GameController:
                     f"Número de payoffs ({len(payoffs)}) no coincide con "
                     f"historias×jugadores_únicos ({len(histories)}×{unique_player_count} = {expected_payoffs})")
             
-            for payoff_index, payoff in enumerate(payoffs):
-                history_index = payoff_index // unique_player_count
-                player_index = payoff_index % unique_player_count
-                
-                if history_index < len(histories):
-                    payoff.history = histories[history_index]
-                    
-                    if player_index < len(unique_players):
-                        payoff.player = unique_players[player_index]
-                        
-                    if hasattr(payoff.history, 'total_probability'):
-                        payoff.calculate_expected_utility(payoff.history.total_probability)
+            slots = zip(payoffs, product(histories, unique_players))
+            if hasattr(histories[0], 'total_probability'):
+                for payoff, (history, player) in slots:
+                    payoff.history = history
+                    payoff.player = player
+                    payoff.calculate_expected_utility(history.total_probability)
+            else:
+                for payoff, (history, player) in slots:
+                    payoff.history = history
+                    payoff.player = player
             
-            game = self._validate_active_game()
             game.payoffs = list(payoffs)
+            self._assigned_payoffs_key = assignment_key
 
             self.logger.log_info(
                 f"[CU-05] {len(payoffs)} payoffs asignados a {len(histories)} historias "
@@ -634,17 +674,12 @@ class GameController:
 
     #Listo
     def _format_histories_for_cli(self, histories_samples: List[History]) -> str:
-        formatted_lines = []
-        for index, history in enumerate(histories_samples, start=1):
-            action_descriptions = [
-                f"{action.label}-{{{action.probability:.1f}}}" 
-                for action in history.actions
-            ]
-            formatted_lines.append(
-                f"HISTORIA {index} -> [{', '.join(action_descriptions)}] -> "
-                f"P = {history.total_probability:.3f}"
-            )
-        return "\n".join(formatted_lines)
+        return "\n".join(
+            f"HISTORIA {index} -> ["
+            + ', '.join([f"{action.label}-{{{action.probability:.1f}}}" for action in history.actions])
+            + f"] -> P = {history.total_probability:.3f}"
+            for index, history in enumerate(histories_samples, start=1)
+        )
 
     # ==========================================================
     # CU-06 — CALCULAR UTILIDADES Y EQUILIBRIOS
@@ -656,19 +691,19 @@ class GameController:
             
             self._validate_utilities_prerequisites(game)
             
-            self._assign_histories_to_payoffs()
+            self._assign_histories_to_payoffs(game)
             
             utilities = self.utility_calculator.calculate_utilities(game.histories, game.payoffs)
             
             self._validate_utilities_result(game, utilities)
             
-            self.session.save_utility_matrix(utilities)
+            self.session.save_utility_matrix(utilities, copy=False)
             
             utility_lines = self._format_utilities_for_cli(game.histories, utilities)
             
-            self.logger.log_info(f"[CU-06] Utilidades calculadas para {len(utilities)} historias")
+            self.logger.log_info("[CU-06] Utilidades calculadas para %d historias", len(utilities))
 
-            update_ok = self.update_game_state("RUNNING")
+            update_ok = self.update_game_state(GameState.RUNNING)
             if not update_ok:
                 raise GameException("No se pudo actualizar el estado del juego.")
             return {
@@ -681,11 +716,12 @@ class GameController:
             self.logger.log_warning(f"[CU-06] Error durante el calcúlo de utilidades: {error.technical_message}")
             raise
         except Exception as error:
-            self.logger.log_error(f"[CU-06] Error inesperado durante el calcúlo de utilidades: {error}")
-            raise OperationError(
-                technical_message=f"Error durante el calcúlo de utilidades: {error}",
-                user_message="Error durante el calcúlo de utilidades."
-            ) 
+            raise self._operation_error(
+                error,
+                "[CU-06] Error inesperado durante el calcúlo de utilidades",
+                "Error durante el calcúlo de utilidades",
+                "Error durante el calcúlo de utilidades."
+            )
 
     #Listo
     def _validate_utilities_prerequisites(self, game: Game) -> None:
@@ -731,21 +767,22 @@ class GameController:
         utilities: List[List[float]]
     ) -> List[str]:
         lines = []
+        utility_templates = [
+            f"J{player_index}={{:.3f}}"
+            for player_index in range(1, (len(utilities[0]) if utilities else 0) + 1)
+        ]
         
         for history_index, history in enumerate(histories):
             if history_index < len(utilities):
                 utility_values = utilities[history_index]
                 
                 action_labels = " -> ".join([
-                    action.label for action in history.actions[:3]
+                    action.label for action in islice(history.actions, 3)
                 ])
                 if len(history.actions) > 3:
                     action_labels += " -> ..."
                     
-                player_utilities = " | ".join([
-                    f"J{player_index + 1}={utility:.3f}" 
-                    for player_index, utility in enumerate(utility_values)
-                ])
+                player_utilities = " | ".join(map(str.format, utility_templates, utility_values))
                 probability_info = f"P={history.total_probability:.4f}"
                 
                 lines.append(
@@ -772,34 +809,34 @@ class GameController:
             
             equilibrium_profiles = self.equilibrium_finder.get_equilibrium_profiles()
             
-            self.session.save_equilibrium_profiles(equilibrium_profiles)
+            self.session.save_equilibrium_profiles(equilibrium_profiles, copy=False)
             
-            equilibria_pages = []
-            
-            for i, profile in enumerate(equilibrium_profiles, 1):
-                profile_lines = self.equilibrium_finder.format_equilibrium_profile(
-                    profile, i, len(equilibrium_profiles)
-                )
-                equilibria_pages.append(profile_lines)
+            total_equilibria = len(equilibrium_profiles)
+            format_profile = self.equilibrium_finder.format_equilibrium_profile
+
+            @lru_cache(maxsize=3)
+            def page_fetcher(index: int) -> List[str]:
+                return format_profile(equilibrium_profiles[index], index + 1, total_equilibria)
             
             self.session.save_equilibria(equilibria)
             
-            self.logger.log_info(f"[CU-06] {len(equilibrium_profiles)} equilibrios identificados")
+            self.logger.log_info("[CU-06] %s equilibrios identificados", total_equilibria)
             return {
                 "success": True,
                 "equilibria": equilibria,
                 "equilibria_profiles": equilibrium_profiles,
-                "equilibria_pages": equilibria_pages,
-                "total_equilibria": len(equilibrium_profiles)
+                "page_fetcher": page_fetcher,
+                "total_equilibria": total_equilibria
             }
         except GameException as error:
             self.logger.log_warning(f"[CU-06] Error identificando equilibrios: {error.technical_message}")
             raise
         except Exception as error:
-            self.logger.log_error(f"[CU-06] Error inesperado durante la identificación de equilibrios: {error}")
-            raise OperationError(
-                technical_message=f"Error identificando equilibrios: {error}",
-                user_message="Error durante la identificación de equilibrios."
+            raise self._operation_error(
+                error,
+                "[CU-06] Error inesperado durante la identificación de equilibrios",
+                "Error identificando equilibrios",
+                "Error durante la identificación de equilibrios."
             )
 
     def _validate_equilibria_prerequisites(self, game: Game) -> None:
@@ -815,7 +852,7 @@ class GameController:
                 user_message="Debe registrar los payoffs primero."
             )
         
-        if not self.session.utility_matrix or len(self.session.utility_matrix) == 0:
+        if not self.session.utility_matrix:
             raise MissingValueError(
                 technical_message="No hay utilidades calculadas",
                 user_message="Debe calcular las utilidades primero."
@@ -827,13 +864,13 @@ class GameController:
         try:
             self._validate_active_game()
             
-            if not self.session.utility_matrix or len(self.session.utility_matrix) == 0:
+            if not self.session.utility_matrix:
                 raise MissingValueError(
                     technical_message="No hay utilidades calculadas para finalizar",
                     user_message="No se han calculado utilidades para finalizar la operación."
                 )
             
-            update_ok = self.update_game_state("RUNNING")
+            update_ok = self.update_game_state(GameState.RUNNING)
             if not update_ok:
                 raise GameException("No se pudo actualizar el estado del juego.")
 
@@ -847,11 +884,12 @@ class GameController:
             self.logger.log_warning(f"[CU-06] Error guardando utilidades: {error.technical_message}")
             raise
         except Exception as error:
-            self.logger.log_error(f"[CU-06] Error inesperado durante el guardado de utilidades: {error}")
-            raise OperationError(
-                technical_message=f"Error guardando utilidades: {error}",
-                user_message="Error durante el guardado de las utilidades en la sesión."
-            ) 
+            raise self._operation_error(
+                error,
+                "[CU-06] Error inesperado durante el guardado de utilidades",
+                "Error guardando utilidades",
+                "Error durante el guardado de las utilidades en la sesión."
+            )
 
 #LISTO    # ===============================================================================================================
 
@@ -870,7 +908,7 @@ class GameController:
             
             stats = self._get_export_statistics(game)
             
-            self.logger.log_info(f"[CU-07] Resultados exportados a Excel: {excel_path}")
+            self.logger.log_info("[CU-07] Resultados exportados a Excel: %s", excel_path)
             return {
                 "success": True,
                 "file_path": excel_path,
@@ -882,11 +920,12 @@ class GameController:
             self.logger.log_warning(f"[CU-07] Error Exportando resultados a excel: {error.technical_message}")
             raise
         except Exception as error:
-            self.logger.log_error(f"[CU-07] Error inesperado durante la exportación de resultados al excel: {error}")
-            raise OperationError(
-                technical_message=f"Error Exportando resultados a excel: {error}",
-                user_message="Error durante la exportación de resultados al excel."
-            ) 
+            raise self._operation_error(
+                error,
+                "[CU-07] Error inesperado durante la exportación de resultados al excel",
+                "Error Exportando resultados a excel",
+                "Error durante la exportación de resultados al excel."
+            )
 
     def _validate_export_prerequisites(self, game: Game) -> None:
         if not game.histories or len(game.histories) == 0:
@@ -913,7 +952,7 @@ class GameController:
             "total_rounds": len(game.rounds),
             "total_histories": len(game.histories),
             "total_payoffs": len(game.payoffs),
-            "total_utilities": len(self.session.utility_matrix) if self.session.utility_matrix else 0,
+            "total_utilities": len(self.session.utility_matrix),
             "total_equilibria": len(self.session.equilibria),
             "game_state": game.state.value,
             "export_timestamp": datetime.now().strftime('%Y-%m-%d %H:%M:%S')
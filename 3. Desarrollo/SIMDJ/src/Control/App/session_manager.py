@@ -1,7 +1,7 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
 from Domain.Core.game import Game, GameState
 from Domain.Core.player import Player
@@ -11,7 +11,7 @@ from Domain.Core.strategy import Strategy
 from Domain.Simulation.equilibrium_finder import EquilibriumProfile
 
 
-from Domain.Common.exceptions import (OperationError)
+from Domain.Common.exceptions import (OperationError, InvalidInputError)
 
 from Infrastructure.Common.logger import Logger
 from Infrastructure.Common.technical_validator import TechnicalValidator
@@ -35,6 +35,8 @@ class SessionManager:
     probability_matrix: List[List[float]] = field(default_factory=list)
     equilibria: List[Strategy] = field(default_factory=list)
     equilibrium_profiles: List[EquilibriumProfile] = field(default_factory=list, repr=False)
+    # Vista inmutable reutilizada por get_equilibrium_profiles; se rehace en save_equilibrium_profiles
+    _equilibrium_profiles_view: Tuple[EquilibriumProfile, ...] = field(default=(), init=False, repr=False)
 
     
     temp_histories: List[History] = field(default_factory=list)
@@ -49,14 +51,16 @@ class SessionManager:
             self.num_rounds = 0
             self.num_strategies = 0
             self.total_histories = 0
-            self.player_order.clear()
-            self.history_list.clear()
-            self.utility_matrix.clear()
-            self.payoffs.clear()
-            self.probabilities.clear()
-            self.probability_matrix.clear()
-            self.equilibria.clear()
-            self.temp_histories.clear()
+            self.player_order = []
+            self.history_list = []
+            self.utility_matrix = []
+            self.payoffs = []
+            self.probabilities = {}
+            self.probability_matrix = []
+            self.equilibria = []
+            self.equilibrium_profiles = []
+            self._equilibrium_profiles_view = ()
+            self.temp_histories = []
             self.active_game = None
             self.created_at = datetime.now().isoformat(timespec="seconds")
             
@@ -71,14 +75,16 @@ class SessionManager:
 
     def clear_session(self) -> None:
         try:
-            self.player_order.clear()
-            self.history_list.clear()
-            self.utility_matrix.clear()
-            self.payoffs.clear()
-            self.probabilities.clear()
-            self.probability_matrix.clear()
-            self.equilibria.clear()
-            self.temp_histories.clear()
+            self.player_order = []
+            self.history_list = []
+            self.utility_matrix = []
+            self.payoffs = []
+            self.probabilities = {}
+            self.probability_matrix = []
+            self.equilibria = []
+            self.equilibrium_profiles = []
+            self._equilibrium_profiles_view = ()
+            self.temp_histories = []
             self.active_game = None
             
             self.logger.log_info("Sesión limpiada")
@@ -100,18 +106,24 @@ class SessionManager:
         self.num_strategies = strategies
         
         self.logger.log_info(
-            f"Configuración actualizada: {players} jugadores, "
-            f"{rounds} rondas, {strategies} estrategias"
+            "Configuración actualizada: %s jugadores, %s rondas, %s estrategias",
+            players, rounds, strategies
         )
 
     def set_player_order(self, order: List[Player]) -> None:
         self.technical_validator.validate_list_not_empty(order, "orden de jugadores")
+        # Solo instancias de game.players: un Player creado aquí quedaría desligado del juego
+        if not all(isinstance(player, Player) for player in order):
+            raise InvalidInputError(
+                technical_message="El orden de jugadores contiene elementos que no son Player",
+                user_message="El orden de jugadores no es válido."
+            )
         self.player_order = list(order)
-        self.logger.log_info(f"Orden de jugadores establecido: {len(order)} jugadores")
+        self.logger.log_info("Orden de jugadores establecido: %s jugadores", len(order))
 
     def set_active_game(self, game: Game) -> None:
         self.active_game = game
-        self.logger.log_info(f"Juego activo establecido: {game.game_id}")
+        self.logger.log_info("Juego activo establecido: %s", game.game_id)
 
     def get_active_game(self) -> Optional[Game]:
         return self.active_game
@@ -124,45 +136,49 @@ class SessionManager:
             raise ValueError("No hay juego activo para actualizar estado")
 
         self.active_game.state = new_state
-        self.logger.log_info(f"Estado del juego actualizado: {new_state.value}")
+        self.logger.log_info("Estado del juego actualizado: %s", new_state.value)
 
-    def save_histories(self, histories: List[History]) -> None:
+    def save_histories(self, histories: List[History]) -> List[History]:
         self.technical_validator.validate_list_not_empty(histories, "historias")
         self.history_list = list(histories)
-        self.logger.log_info(f"{len(histories)} historias guardadas en sesión")
+        self.logger.log_info("%s historias guardadas en sesión", len(histories))
+        return self.history_list
 
     def save_temp_histories(self, temp_histories: List[History]) -> None:
         self.technical_validator.validate_list_not_empty(temp_histories, "historias temporales")
         self.temp_histories = list(temp_histories)
-        self.logger.log_info(f"{len(temp_histories)} historias temporales guardadas")
+        self.logger.log_info("%s historias temporales guardadas", len(temp_histories))
 
-    def save_utility_matrix(self, utilities: List[List[float]]) -> None:
+    # copy=False en los save_*: la sesión toma el objeto tal cual; el llamador no debe modificarlo después
+    def save_utility_matrix(self, utilities: List[List[float]], *, copy: bool = True) -> None:
         self.technical_validator.validate_list_not_empty(utilities, "matriz de utilidades")
-        self.utility_matrix = [list(row) for row in utilities]
+        self.utility_matrix = [list(row) for row in utilities] if copy else utilities
         self.logger.log_info("Matriz de utilidades guardada en sesión")
 
-    def save_payoffs(self, payoffs: List[Payoff]) -> None:
+    def save_payoffs(self, payoffs: List[Payoff]) -> List[Payoff]:
         self.technical_validator.validate_list_not_empty(payoffs, "payoffs")
         self.payoffs = list(payoffs)
-        self.logger.log_info(f"{len(payoffs)} payoffs guardados en sesión")
+        self.logger.log_info("%s payoffs guardados en sesión", len(payoffs))
+        return self.payoffs
 
-    def save_probabilities(self, probabilities: Dict[str, Any]) -> None:
+    def save_probabilities(self, probabilities: Dict[str, Any], *, copy: bool = True) -> None:
         self.technical_validator.validate_list_not_empty(probabilities, "Probabilidades")
-        self.probabilities = dict(probabilities)
+        self.probabilities = dict(probabilities) if copy else probabilities
         self.logger.log_info("Probabilidades guardadas en sesión")
 
-    def save_equilibria(self, equilibria: List[Strategy]) -> None:
+    def save_equilibria(self, equilibria: List[Strategy], *, copy: bool = True) -> None:
         self.technical_validator.validate_list_not_empty(equilibria, "Equilibrios")        
-        self.equilibria = list(equilibria)
-        self.logger.log_info(f"{len(equilibria)} equilibrios guardados en sesión")
+        self.equilibria = list(equilibria) if copy else equilibria
+        self.logger.log_info("%s equilibrios guardados en sesión", len(equilibria))
 
-    def save_equilibrium_profiles(self, profiles: List[EquilibriumProfile]) -> None:
+    def save_equilibrium_profiles(self, profiles: List[EquilibriumProfile], *, copy: bool = True) -> None:
         self.technical_validator.validate_list_not_empty(profiles, "perfiles de equilibrio")
-        self.equilibrium_profiles = list(profiles)
-        self.logger.log_info(f"{len(profiles)} perfiles de equilibrio guardados en sesión")
+        self.equilibrium_profiles = list(profiles) if copy else profiles
+        self._equilibrium_profiles_view = tuple(self.equilibrium_profiles)
+        self.logger.log_info("%s perfiles de equilibrio guardados en sesión", len(profiles))
 
-    def get_equilibrium_profiles(self) -> List[EquilibriumProfile]:
-        return list(self.equilibrium_profiles)
+    def get_equilibrium_profiles(self) -> Tuple[EquilibriumProfile, ...]:
+        return self._equilibrium_profiles_view
 
     def get_summary(self) -> Dict[str, Any]:
         try:
@@ -180,8 +196,10 @@ class SessionManager:
                         "name": getattr(player, 'name', 'N/A')
                     })
 
-            utility_rows = len(self.utility_matrix)
-            utility_cols = len(self.utility_matrix[0]) if self.utility_matrix and len(self.utility_matrix) > 0 else 0
+            utility_matrix = self.utility_matrix
+            utility_rows = len(utility_matrix)
+            utility_cols = len(utility_matrix[0]) if utility_rows else 0
+            histories_generated = len(self.history_list)
             
             return {
                 "created_at": self.created_at,
@@ -194,14 +212,14 @@ class SessionManager:
                 "active_game_state": game_state,
                 "player_order": player_summaries,
                 "total_histories_expected": self.total_histories,
-                "total_histories_generated": len(self.history_list),
+                "total_histories_generated": histories_generated,
                 "total_temp_histories": len(self.temp_histories),
                 "total_payoffs": len(self.payoffs),
                 "total_equilibria": len(self.equilibria),
                 "has_probabilities": bool(self.probabilities or self.probability_matrix),
                 "utility_shape": (utility_rows, utility_cols),
                 "has_utilities": utility_rows > 0,
-                "has_histories": len(self.history_list) > 0
+                "has_histories": histories_generated > 0
             }
             
         except Exception as error:
@@ -1,6 +1,9 @@
 from __future__ import annotations
+import math
+from bisect import bisect_right
 from dataclasses import dataclass
-from typing import Any, Dict, List, TYPE_CHECKING
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple, TYPE_CHECKING
 
 from .exceptions import (
     ConfigurationError, InvalidInputError, ValidationError,
@@ -16,6 +19,39 @@ if TYPE_CHECKING:
     from ..Core.player import Player
 
 
+# Centinela para distinguir atributo ausente de un valor falsy (p. ej. probabilidad 0.0)
+_MISSING = object()
+
+# Umbrales de escenarios (exclusivos) que separan cada nivel de complejidad
+_COMPLEXITY_THRESHOLDS = (100, 1000, 10000)
+_COMPLEXITY_LEVELS = ("BAJA", "MEDIA", "ALTA", "EXTREMA")
+
+
+@lru_cache(maxsize=256)
+def _calc_game_metrics(rounds: int, strategies: int) -> Tuple[int, int, str]:
+    try:
+        S, E = strategies, rounds
+        
+        if S == 1:
+            total_scenarios = 1
+            total_strategies = 1
+        else:
+            total_scenarios = (S ** E - 1) // (S - 1)
+            # (S^E - S^2)/(S - 1) = total_scenarios - (S + 1), así que no hace falta otra división
+            total_strategies = total_scenarios + S - 1
+        
+        # Determinar nivel de complejidad
+        complexity_level = _COMPLEXITY_LEVELS[bisect_right(_COMPLEXITY_THRESHOLDS, total_scenarios)]
+        
+        return total_scenarios, total_strategies, complexity_level
+        
+    except (ValueError, ZeroDivisionError, OverflowError) as e:
+        raise ValidationError(
+            technical_message=f"Error en cálculo de complejidad: {e}",
+            user_message="Error al calcular la complejidad del juego."
+        )
+
+
 @dataclass
 class DomainValidator:
     def validate_player_order_configuration(
@@ -35,24 +71,18 @@ class DomainValidator:
                 user_message=f"Debe ingresar exactamente {len(game_players)} IDs de jugadores."
             )
         
-        player_id_map = {player.player_id: player for player in game_players}
-        missing_ids = []
-        
-        for pid in player_ids:
-            if pid not in player_id_map:
-                missing_ids.append(str(pid))
+        known_ids = {player.player_id for player in game_players}
+        if known_ids.issuperset(player_ids):
+            return
         
+        # Solo en el caso de error se arma la lista completa para el mensaje.
+        # Player valida ids positivos, así que un id <= 0 siempre cae en missing_ids
+        missing_ids = [str(pid) for pid in player_ids if pid not in known_ids]
         if missing_ids:
             raise PlayerOrderError(
                 technical_message=f"Jugadores con IDs {', '.join(missing_ids)} no encontrados",
                 user_message=f"Los jugadores con IDs {', '.join(missing_ids)} no existen en el juego."
             )
-        
-        if any(pid <= 0 for pid in player_ids):
-            raise InvalidInputError(
-                technical_message="IDs de jugadores no positivos",
-                user_message="Todos los IDs de jugadores deben ser números positivos."
-            )
 
     def validate_game_state_for_configuration(self, game: Game) -> None:
         if game.state != GameState.CREATED:
@@ -61,39 +91,6 @@ class DomainValidator:
                 user_message="Solo se puede configurar el orden en juegos recién creados."
             )
 
-    def _calculate_game_metrics(self, rounds: int, strategies: int) -> Dict[str, Any]:
-        try:
-            S, E = strategies, rounds
-            
-            if S == 1:
-                total_scenarios = 1
-                total_strategies = 1
-            else:
-                total_scenarios = (S ** E - 1) // (S - 1)
-                total_strategies = ((S ** E - S ** 2) // (S - 1)) + 2 * S
-            
-            # Determinar nivel de complejidad
-            if total_scenarios < 100:
-                complexity_level = "BAJA"
-            elif total_scenarios < 1000:
-                complexity_level = "MEDIA"
-            elif total_scenarios < 10000:
-                complexity_level = "ALTA"
-            else:
-                complexity_level = "EXTREMA"
-            
-            return {
-                "scenarios": total_scenarios,
-                "strategies": total_strategies,
-                "complexity_level": complexity_level
-            }
-            
-        except (ValueError, ZeroDivisionError, OverflowError) as e:
-            raise ValidationError(
-                technical_message=f"Error en cálculo de complejidad: {e}",
-                user_message="Error al calcular la complejidad del juego."
-            )
-
     def validate_game_complexity(
         self, 
         rounds: int, 
@@ -101,23 +98,33 @@ class DomainValidator:
         max_scenarios: int = 30000, 
         max_strategies: int = 30000
     ) -> Dict[str, Any]:
-        metrics = self._calculate_game_metrics(rounds, strategies)
+        # Cota en espacio logarítmico: descarta juegos enormes sin calcular S ** E exacto
+        if strategies > 1:
+            log_scenarios = rounds * math.log(strategies) - math.log(strategies - 1)
+            if log_scenarios > math.log(max_scenarios) + 1.0:
+                raise ComplexityError(
+                    scenarios=f"más de {max_scenarios}",
+                    strategies=f"más de {max_strategies}"
+                )
+
+        total_scenarios, total_strategies, complexity_level = _calc_game_metrics(rounds, strategies)
         
-        if (metrics["scenarios"] >= max_scenarios or 
-            metrics["strategies"] > max_strategies):
+        if (total_scenarios >= max_scenarios or 
+            total_strategies > max_strategies):
             raise ComplexityError(
-                scenarios=metrics["scenarios"], 
-                strategies=metrics["strategies"]
+                scenarios=total_scenarios, 
+                strategies=total_strategies
             )
         
         return {
             "is_valid": True,
-            **metrics
+            "scenarios": total_scenarios,
+            "strategies": total_strategies,
+            "complexity_level": complexity_level
         }
 
     def get_game_complexity_level(self, rounds: int, strategies: int) -> str:
-        metrics = self._calculate_game_metrics(rounds, strategies)
-        return metrics["complexity_level"]
+        return _calc_game_metrics(rounds, strategies)[2]
 
     def validate_probability_assignments(
         self,
@@ -136,6 +143,9 @@ class DomainValidator:
                 user_message="La cantidad de acciones y valores de probabilidad debe coincidir."
             )
         
+        if 0 <= min(values) and max(values) <= 1:
+            return
+
         for i, value in enumerate(values):
             if value < 0 or value > 1:
                 raise ProbabilityAssignmentError(
@@ -150,13 +160,13 @@ class DomainValidator:
                 user_message="No hay estructura de juego para generar historias."
             )
         
-        if not hasattr(tree, 'scenarios') or not tree.scenarios:
+        if not getattr(tree, 'scenarios', None):
             raise HistoryGenerationError(
                 technical_message="Árbol sin escenarios",
                 user_message="El juego no tiene escenarios definidos."
             )
         
-        if not hasattr(tree, 'root') or not tree.root:
+        if not getattr(tree, 'root', None):
             raise HistoryGenerationError(
                 technical_message="Árbol sin nodo raíz",
                 user_message="El juego no tiene un nodo inicial definido."
@@ -180,20 +190,20 @@ class DomainValidator:
             )
         
         for i, history in enumerate(histories):
-            if not hasattr(history, 'total_probability'):
+            if getattr(history, 'total_probability', _MISSING) is _MISSING:
                 raise UtilityCalculationError(
                     technical_message=f"Historia {i+1} sin probabilidad total",
                     user_message="Las historias deben tener probabilidades calculadas."
                 )
         
         for i, payoff in enumerate(payoffs):
-            if not hasattr(payoff, 'history') or not payoff.history:
+            if not getattr(payoff, 'history', None):
                 raise UtilityCalculationError(
                     technical_message=f"Payoff {i+1} sin historia asociada",
                     user_message="Cada pago debe estar asociado a una historia."
                 )
             
-            if not hasattr(payoff, 'player') or not payoff.player:
+            if not getattr(payoff, 'player', None):
                 raise UtilityCalculationError(
                     technical_message=f"Payoff {i+1} sin jugador asociado",
                     user_message="Cada pago debe estar asociado a un jugador."
@@ -220,13 +230,13 @@ class DomainValidator:
                 user_message="No hay jugadores definidos en el juego."
             )
         
-        if not hasattr(game, 'scenarios') or not game.scenarios:
+        if not getattr(game, 'scenarios', None):
             raise EquilibriumFindingError(
                 technical_message="Juego sin escenarios",
                 user_message="El juego no tiene escenarios definidos."
             )
         
-        if not hasattr(game, 'actions') or not game.actions:
+        if not getattr(game, 'actions', None):
             raise EquilibriumFindingError(
                 technical_message="Juego sin acciones",
                 user_message="El juego no tiene acciones definidas."
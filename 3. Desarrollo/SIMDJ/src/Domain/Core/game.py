@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional
+from operator import attrgetter
+from typing import Any, Dict, List, Optional, Tuple
 
 from .player import Player
 from .round import Round
@@ -44,6 +46,11 @@ class Game:
     strategies_per_player: int = field(default=0)
     num_rounds: int = field(default=0)
     num_strategies: int = field(default=0)
+
+    # Índices por id construidos bajo demanda: nombre de lista -> (lista, tamaño, índice)
+    _indexes: Dict[str, Tuple[List[Any], int, Dict[int, Any]]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
     
     def __post_init__(self) -> None:
         if not self.name:
@@ -88,6 +95,18 @@ class Game:
     def get_id(self) -> int:
         return self.game_id
 
+    def _get_index(self, list_name: str, key_attr: str) -> Dict[int, Any]:
+        items = getattr(self, list_name)
+        cached = self._indexes.get(list_name)
+        # Se reconstruye si la lista fue reemplazada o cambió de tamaño
+        if cached is None or cached[0] is not items or cached[1] != len(items):
+            index: Dict[int, Any] = {}
+            get_key = attrgetter(key_attr)
+            for item in items:
+                index.setdefault(get_key(item), item)
+            cached = self._indexes[list_name] = (items, len(items), index)
+        return cached[2]
+
     def add_player(self, player: Player) -> None:
         if player not in self.players:
             self.players.append(player)
@@ -95,14 +114,12 @@ class Game:
     def remove_player(self, player: Player) -> bool:
         if player in self.players:
             self.players.remove(player)
+            self._indexes.pop("players", None)
             return True
         return False
 
     def get_player_by_id(self, player_id: int) -> Optional[Player]:
-        for player in self.players:
-            if player.player_id == player_id:
-                return player
-        return None
+        return self._get_index("players", "player_id").get(player_id)
 
     def add_round(self, round_obj: Round) -> None:
         if round_obj not in self.rounds:
@@ -111,24 +128,19 @@ class Game:
     def remove_round(self, round_obj: Round) -> bool:
         if round_obj in self.rounds:
             self.rounds.remove(round_obj)
+            self._indexes.pop("rounds", None)
             return True
         return False
 
     def get_round_by_number(self, round_number: int) -> Optional[Round]:
-        for round_obj in self.rounds:
-            if round_obj.round_number == round_number:
-                return round_obj
-        return None
+        return self._get_index("rounds", "round_number").get(round_number)
 
     def add_scenario(self, scenario: Scenario) -> None:
         if scenario not in self.scenarios:
             self.scenarios.append(scenario)
 
     def get_scenario_by_id(self, scenario_id: int) -> Optional[Scenario]:
-        for scenario in self.scenarios:
-            if scenario.scenario_id == scenario_id:
-                return scenario
-        return None
+        return self._get_index("scenarios", "scenario_id").get(scenario_id)
 
     def add_action(self, action: Action) -> None:
         if action not in self.actions:
@@ -261,14 +273,13 @@ class Game:
         }
 
     def get_total_expected_utility(self) -> float:
-        return sum(payoff.expected_utility for payoff in self.payoffs)
+        return sum(map(attrgetter("expected_utility"), self.payoffs))
 
     def get_player_utilities(self) -> Dict[int, float]:
-        utilities = {}
+        utilities: Dict[int, float] = defaultdict(float)
         for payoff in self.payoffs:
-            player_id = payoff.player.player_id
-            utilities[player_id] = utilities.get(player_id, 0.0) + payoff.expected_utility
-        return utilities
+            utilities[payoff.player.player_id] += payoff.expected_utility
+        return dict(utilities)
 
     def __hash__(self) -> int:
         return hash(self.game_id)
@@ -1,9 +1,8 @@
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass, field
 from typing import List, Optional
-from functools import reduce
-from operator import mul
 
 from .action import Action
 
@@ -53,8 +52,9 @@ class History:
             return 0.0
         
         try:
-            probabilities = [action.probability for action in self.actions]
-            self.total_probability = reduce(mul, probabilities, 1.0)
+            self.total_probability = math.prod(
+                (action.probability for action in self.actions), start=1.0
+            )
             return self.total_probability
         except (TypeError, ValueError) as e:
             raise ValueError(f"Error calculando probabilidad de historia: {e}")
@@ -8,7 +8,7 @@ if TYPE_CHECKING:
     from .history import History
 
 
-@dataclass
+@dataclass(slots=True)
 class Payoff:
     payoff_id: int
     player: Player
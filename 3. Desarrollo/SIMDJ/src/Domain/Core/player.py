@@ -33,6 +33,11 @@ class Player:
     def player_id(self, value: int) -> None:
         self._validate_player_id(value)
         self._player_id = value
+        self._label = f"J{value}"
+
+    @property
+    def label(self) -> str:
+        return self._label
 
     def add_strategy(self, strategy: Strategy) -> None:
         if strategy not in self.strategies:
@@ -214,7 +214,7 @@ class EquilibriumFinder:
                     self.logger.log_warning(f"No se pudo determinar jugador activo para escenario {strategy.from_scenario.scenario_id}")
                     continue
                     
-                player_label = f"J{active_player.player_id}"
+                player_label = active_player.label
                 
                 destination = "Terminal"
                 if strategy.action.destination_scenario:
@@ -264,7 +264,7 @@ class EquilibriumFinder:
         payoffs: List[Payoff],
         players: List[Player]
     ) -> Dict[str, float]:
-        result = {f"J{p.player_id}": 0.0 for p in players}
+        result = {p.label: 0.0 for p in players}
         
         for history in histories:
             if action in history.actions:
@@ -275,7 +275,7 @@ class EquilibriumFinder:
                         prev_action.destination_scenario.scenario_id == scenario.scenario_id):
                         for payoff in payoffs:
                             if payoff.history.history_id == history.history_id:
-                                player_label = f"J{payoff.player.player_id}"
+                                player_label = payoff.player.label
                                 result[player_label] = payoff.value
                         break
         
@@ -303,7 +303,7 @@ class EquilibriumFinder:
             return [0.0] * len(players)
         
         last_step = steps[-1]
-        return [last_step.payoffs.get(f"J{p.player_id}", 0.0) for p in players]
+        return [last_step.payoffs.get(p.label, 0.0) for p in players]
 
     def _build_adjacency(self, game: Game) -> Dict[int, List[Action]]:
         adjacency: Dict[int, List[Action]] = {}
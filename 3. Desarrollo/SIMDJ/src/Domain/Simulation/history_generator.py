@@ -24,6 +24,7 @@ class HistoryGenerator:
         self.tree: Optional[Game] = None
         self.actions: List[Action] = []
         self.path_buffer: List[Action] = []
+        self._path_ids: List[int] = []
         self._cycle_guard: Set[Tuple[int, Tuple[int, ...]]] = set()
 
         self.logger = logger
@@ -69,12 +70,12 @@ class HistoryGenerator:
                 adjacency[scenario_id].sort(key=lambda a: a.action_id)
 
             self.path_buffer = []
+            self._path_ids = []
             self._cycle_guard.clear()
 
+            # History calcula total_probability al construirse en _dfs
             self._dfs(root, adjacency)
 
-            self._calculate_all_probabilities()
-
             tree.histories = self.histories
 
             self.logger.log_info(
@@ -98,6 +99,7 @@ class HistoryGenerator:
     def clear_histories(self) -> None:
         self.histories.clear()
         self.path_buffer.clear()
+        self._path_ids.clear()
         self._cycle_guard.clear()
 
     def _dfs(
@@ -134,12 +136,12 @@ class HistoryGenerator:
                     )
                     continue
 
-                new_path_ids = tuple(
-                    a.action_id for a in (self.path_buffer + [action])
-                )
+                self._path_ids.append(action.action_id)
+                new_path_ids = tuple(self._path_ids)
                 guard_key = (destination.scenario_id, new_path_ids)
 
                 if guard_key in self._cycle_guard:
+                    self._path_ids.pop()
                     self.logger.log_warning(
                         f"[HistoryGenerator] Ciclo detectado: "
                         f"Scenario {destination.scenario_id}, path={new_path_ids}"
@@ -150,6 +152,7 @@ class HistoryGenerator:
                 self.path_buffer.append(action)
                 self._dfs(destination, adjacency)
                 self.path_buffer.pop()
+                self._path_ids.pop()
         except (HistoryGenerationError) as error:
             self.logger.log_warning(
                 f"[HistoryGenerator] Error generando historias al hacer una búsqueda de profundidad: {error.technical_message}")
@@ -161,19 +164,6 @@ class HistoryGenerator:
                 user_message="Error al generar las historias del juego al hacer una búsqueda de profundidad."
             )
 
-    def _calculate_all_probabilities(self) -> None:
-        for history in self.histories:
-            try:
-                history.calculate_probability()
-            except Exception as error:
-                self.logger.log_warning(
-                    f"[HistoryGenerator] Error calculando probabilidad de historia {history.history_id}: {error}"
-                )
-                raise HistoryGenerationError(
-                technical_message=f"Error técnico generando historias: {error}",
-                user_message=f"Error calculando probabilidad de historia {history.history_id}"
-                )
-
     def _rebuild_adjacency_from_actions(
         self, 
         actions: List[Action]
@@ -91,12 +91,14 @@ class ProbabilityAssigner:
                 user_message="Error al validar las probabilidades del escenario."
             )
 
-    def normalize_probabilities(self, actions: List[Action]) -> None:
+    def normalize_probabilities(self, actions: List[Action]) -> List[float]:
         try:
-            total = sum(
-                self.probabilities.get(action.action_id, action.probability)
+            probabilities = self.probabilities
+            current = [
+                probabilities.get(action.action_id, action.probability)
                 for action in actions
-            )
+            ]
+            total = sum(current)
 
             if total <= 0:
                 raise ProbabilityAssignmentError(
@@ -104,17 +106,16 @@ class ProbabilityAssigner:
                     user_message="No se pueden normalizar probabilidades con suma total cero o negativa."
                 )
 
-            for action in actions:
-                new_probability = (
-                    self.probabilities.get(action.action_id, action.probability) / total
-                )
-                self.probabilities[action.action_id] = new_probability
+            normalized = [value / total for value in current]
+            for action, new_probability in zip(actions, normalized):
+                probabilities[action.action_id] = new_probability
                 action.probability = new_probability
 
             self.logger.log_info(
                 f"[ProbabilityAssigner] Normalización aplicada a {len(actions)} acciones "
                 f"(total previo={total:.6f})."
             )
+            return normalized
             
         except ProbabilityAssignmentError:
             raise
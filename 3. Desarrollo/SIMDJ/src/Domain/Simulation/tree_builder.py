@@ -1,4 +1,6 @@
 from __future__ import annotations
+from functools import lru_cache
+from itertools import count
 from typing import List, Dict
 
 from Domain.Core.game import Game, GameState
@@ -31,28 +33,34 @@ class TreeBuilder:
         self.logger = logger
         self.domain_validator = domain_validator
 
-    def calculate_total_scenarios(self, rounds: int, strategies: int) -> int:
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def calculate_total_scenarios(rounds: int, strategies: int) -> int:
         S, E = strategies, rounds
         if S == 1:
             return 1
         return (S ** E - 1) // (S - 1)
 
-    def calculate_total_strategies(self, rounds: int, strategies: int) -> int:
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def calculate_total_strategies(rounds: int, strategies: int) -> int:
         S, E = strategies, rounds
         if S == 1:
             return 1
         return ((S ** E - S ** 2) // (S - 1)) + 2 * S
 
-    def calculate_total_histories(self, rounds: int, strategies: int) -> int:
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def calculate_total_histories(rounds: int, strategies: int) -> int:
         return strategies ** rounds
 
     def create_scenarios(self, rounds: int, strategies: int) -> List[Scenario]:
         try:
             scenarios: List[Scenario] = []
-            scenario_id = 0
+            next_scenario_id = count().__next__
 
             root = Scenario(
-                scenario_id=scenario_id, 
+                scenario_id=next_scenario_id(), 
                 depth=0, 
                 scenario_type="normal", 
                 label="X0"
@@ -60,34 +68,34 @@ class TreeBuilder:
             scenarios.append(root)
 
             level = [root]
-            x_count = 0
-            z_count = 0
+            next_x_index = count(1).__next__
+            next_z_index = count(1).__next__
+
+            add_scenario = scenarios.append
 
             for depth in range(1, rounds + 1):
                 next_level = []
+                add_to_level = next_level.append
+                is_final = depth == rounds
+                node_type = "final" if is_final else "normal"
 
                 for parent in level:
+                    add_child = parent.children.append
                     for _ in range(strategies):
-                        scenario_id += 1
-
-                        node_type = "final" if depth == rounds else "normal"
-
                         scenario = Scenario(
-                            scenario_id=scenario_id,
+                            scenario_id=next_scenario_id(),
                             depth=depth,
                             scenario_type=node_type
                         )
 
-                        if node_type == "final":
-                            z_count += 1
-                            scenario.label = f"Z{z_count}"
+                        if is_final:
+                            scenario.label = f"Z{next_z_index()}"
                         else:
-                            x_count += 1
-                            scenario.label = f"X{x_count}"
+                            scenario.label = f"X{next_x_index()}"
 
-                        parent.children.append(scenario)
-                        scenarios.append(scenario)
-                        next_level.append(scenario)
+                        add_child(scenario)
+                        add_scenario(scenario)
+                        add_to_level(scenario)
 
                 next_level.sort(key=lambda s: s.scenario_id)
                 level = next_level
@@ -84,28 +84,23 @@ class UtilityCalculator:
             num_players = len(players)
             num_histories = len(histories)
 
-            self.utility_matrix = [
-                [0.0 for _ in range(num_players)]
-                for _ in range(num_histories)
-            ]
-
-            payoff_map = {}
-            for payoff in payoffs:
-                payoff_map[
-                    (payoff.player.player_id, payoff.history.history_id)
-                ] = payoff.value
-
-            for history_index, history in enumerate(histories):
+            payoff_map = {
+                (payoff.player.player_id, payoff.history.history_id): payoff.value
+                for payoff in payoffs
+            }
+            payoff_value = payoff_map.get
+            player_ids = [player.player_id for player in players]
+
+            utility_matrix = []
+            append_row = utility_matrix.append
+            for history in histories:
                 probability = history.total_probability or 0.0
-
-                for player_index, player in enumerate(players):
-                    payoff_value = payoff_map.get(
-                        (player.player_id, history.history_id),
-                        0.0
-                    )
-
-                    utility_value = payoff_value * probability
-                    self.utility_matrix[history_index][player_index] = utility_value
+                history_id = history.history_id
+                append_row([
+                    payoff_value((player_id, history_id), 0.0) * probability
+                    for player_id in player_ids
+                ])
+            self.utility_matrix = utility_matrix
 
             for payoff in payoffs:
                 probability = payoff.history.total_probability or 0.0
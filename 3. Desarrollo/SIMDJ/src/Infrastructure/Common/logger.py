@@ -56,11 +56,16 @@ class Logger:
         if self.console_output:
             print(entry)
 
-    def log_info(self, message: str) -> None:
-        self._write_log_entry("INFO", message)
+    def _log(self, level: str, message: str, args: tuple) -> None:
+        if self.LOG_LEVELS[level] < self.LOG_LEVELS.get(self.log_level, 1):
+            return
+        self._write_log_entry(level, message % args if args else message)
+
+    def log_info(self, message: str, *args: object) -> None:
+        self._log("INFO", message, args)
 
-    def log_warning(self, message: str) -> None:
-        self._write_log_entry("WARNING", message)
+    def log_warning(self, message: str, *args: object) -> None:
+        self._log("WARNING", message, args)
 
-    def log_error(self, message: str) -> None:
-        self._write_log_entry("ERROR", message)
\ No newline at end of file
+    def log_error(self, message: str, *args: object) -> None:
+        self._log("ERROR", message, args)
\ No newline at end of file
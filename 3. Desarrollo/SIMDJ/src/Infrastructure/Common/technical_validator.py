@@ -53,7 +53,7 @@ class TechnicalValidator:
             )
 
     def validate_list_not_empty(self, data: Sequence[Any], field_name: str = "lista") -> None:
-        if data is None or len(data) == 0:
+        if not data:
             raise TechnicalValidationError(
                 technical_message=f"La {field_name} está vacía o es nula",
                 user_message=f"La {field_name} no puede estar vacía"
@@ -1,7 +1,6 @@
 from __future__ import annotations
 from pathlib import Path
-from typing import List, Dict
-import pandas as pd
+from typing import TYPE_CHECKING, List, Dict
 
 from Infrastructure.Common.logger import Logger
 from Infrastructure.Common.technical_validator import TechnicalValidator
@@ -11,6 +10,14 @@ from Control.App.session_manager import SessionManager
 from Domain.Core.scenario import Scenario
 from Domain.Core.strategy import Strategy
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def _pd():
+    # pandas solo se carga al exportar, no al iniciar la CLI
+    import pandas
+    return pandas
 
 
 class ExcelExporter:
@@ -47,6 +54,8 @@ class ExcelExporter:
             raise
 
     def export_complete_game(self, game: Game, session: SessionManager) -> str:
+        pd = _pd()
+
         try:
             base_name = self.naming_service.generate_file_name(
                 len(game.players), len(game.rounds), game.num_strategies, "Game"
@@ -71,6 +80,8 @@ class ExcelExporter:
             raise
 
     def _export_game_configuration(self, game: Game, writer: pd.ExcelWriter) -> None:
+        pd = _pd()
+
         escenarios_normales = self._count_normal_scenarios(game.scenarios)
         
         config_data = {
@@ -104,6 +115,8 @@ class ExcelExporter:
         worksheet.column_dimensions['B'].width = 20
 
     def _export_probabilities(self, game: Game, writer: pd.ExcelWriter) -> None:
+        pd = _pd()
+
         data = []
         estrategia_counter = 1
         
@@ -136,38 +149,21 @@ class ExcelExporter:
                 worksheet.column_dimensions[col].width = 18
 
     def _export_histories(self, game: Game, session: SessionManager, writer: pd.ExcelWriter) -> None:
-        data = []
+        pd = _pd()
+
         histories = session.history_list or game.histories
         
-        for history in histories:
-            action_labels = []
-            action_probabilities = []
-            
-            for action in history.actions:
-                action_labels.append(action.label if hasattr(action, 'label') else f"A{action.action_id}")
-                action_probabilities.append(getattr(action, 'probability', 0.0))
-            
-            action_sequence = " → ".join(action_labels)
-            
-            prob_strs = [f"({prob:.2f})" for prob in action_probabilities]
-            valor_secuencia = "*".join(prob_strs)
-            
-            data.append([
-                history.history_id,
-                action_sequence,
-                valor_secuencia,
-                history.total_probability,
-                len(history.actions)
-            ])
-        
-        if data:
-            df = pd.DataFrame(data, columns=[
-                'ID Historia', 
-                'Secuencia de Acciones', 
-                'Valor secuencia',
-                'Probabilidad Total',
-                'Número de Acciones'
-            ])
+        if histories:
+            df = pd.DataFrame.from_records(
+                (self._history_row(history) for history in histories),
+                columns=[
+                    'ID Historia', 
+                    'Secuencia de Acciones', 
+                    'Valor secuencia',
+                    'Probabilidad Total',
+                    'Número de Acciones'
+                ]
+            )
             df.to_excel(writer, sheet_name='Historias', index=False)
             
             worksheet = writer.sheets['Historias']
@@ -177,40 +173,47 @@ class ExcelExporter:
             worksheet.column_dimensions['D'].width = 20
             worksheet.column_dimensions['E'].width = 18
 
+    @staticmethod
+    def _history_row(history) -> tuple:
+        action_labels = []
+        action_probabilities = []
+        
+        for action in history.actions:
+            action_labels.append(action.label if hasattr(action, 'label') else f"A{action.action_id}")
+            action_probabilities.append(getattr(action, 'probability', 0.0))
+        
+        action_sequence = " → ".join(action_labels)
+        
+        prob_strs = [f"({prob:.2f})" for prob in action_probabilities]
+        valor_secuencia = "*".join(prob_strs)
+        
+        return (
+            history.history_id,
+            action_sequence,
+            valor_secuencia,
+            history.total_probability,
+            len(history.actions)
+        )
+
     def _export_utilities(self, game: Game, session: SessionManager, writer: pd.ExcelWriter) -> None:
-        data = []
+        pd = _pd()
+
         payoffs = session.payoffs or game.payoffs
         
-        for payoff in payoffs:
-            history_id = payoff.history.history_id if payoff.history else 'N/A'
-            player_id = payoff.player.player_id if payoff.player else 'N/A'
-            
-            history_prob = 0.0
-            if payoff.history and hasattr(payoff.history, 'total_probability'):
-                history_prob = payoff.history.total_probability
-            
-            data.append([
-                payoff.payoff_id,
-                history_id,
-                history_prob,
-                player_id,
-                f"Jugador {player_id}",
-                payoff.value,
-                payoff.expected_utility,
-                getattr(payoff, 'description', f'Pago {payoff.payoff_id}')
-            ])
-        
-        if data:
-            df = pd.DataFrame(data, columns=[
-                'ID Payoff',
-                'ID Historia',
-                'Probabilidad Historia',
-                'ID Jugador',
-                'Jugador',
-                'Valor Payoff',
-                'Utilidad Esperada',
-                'Descripción'
-            ])
+        if payoffs:
+            df = pd.DataFrame.from_records(
+                (self._utility_row(payoff) for payoff in payoffs),
+                columns=[
+                    'ID Payoff',
+                    'ID Historia',
+                    'Probabilidad Historia',
+                    'ID Jugador',
+                    'Jugador',
+                    'Valor Payoff',
+                    'Utilidad Esperada',
+                    'Descripción'
+                ]
+            )
             df.to_excel(writer, sheet_name='Utilidades', index=False)
             
             # Ajustar ancho de columnas
@@ -224,7 +227,29 @@ class ExcelExporter:
             worksheet.column_dimensions['G'].width = 20
             worksheet.column_dimensions['H'].width = 20
 
+    @staticmethod
+    def _utility_row(payoff) -> tuple:
+        history_id = payoff.history.history_id if payoff.history else 'N/A'
+        player_id = payoff.player.player_id if payoff.player else 'N/A'
+        
+        history_prob = 0.0
+        if payoff.history and hasattr(payoff.history, 'total_probability'):
+            history_prob = payoff.history.total_probability
+        
+        return (
+            payoff.payoff_id,
+            history_id,
+            history_prob,
+            player_id,
+            f"Jugador {player_id}",
+            payoff.value,
+            payoff.expected_utility,
+            getattr(payoff, 'description', f'Pago {payoff.payoff_id}')
+        )
+
     def _export_equilibria(self, game: Game, session: SessionManager, writer: pd.ExcelWriter) -> None:
+        pd = _pd()
+
         try:
             equilibria = session.equilibria or []
             
@@ -321,7 +346,7 @@ class ExcelExporter:
             
             for strategy in strategies_sorted:
                 active_player = self._get_active_player_for_strategy(strategy, game)
-                player_label = f"J{active_player.player_id}" if active_player else "J?"
+                player_label = active_player.label if active_player else "J?"
                 
                 destination = "Terminal"
                 if strategy.action.destination_scenario:
@@ -372,12 +397,14 @@ class ExcelExporter:
         
         for payoff in game.payoffs:
             if payoff.history and strategy.action in payoff.history.actions:
-                player_label = f"J{payoff.player.player_id}"
+                player_label = payoff.player.label
                 payoffs[player_label] = payoff.value
         
         return payoffs
 
     def _export_equilibria_simple(self, game: Game, session: SessionManager, writer: pd.ExcelWriter) -> None:
+        pd = _pd()
+
         try:
             data = []
             equilibria = session.equilibria or []
@@ -414,6 +441,8 @@ class ExcelExporter:
 
 
     def _export_summary(self, game: Game, session: SessionManager, writer: pd.ExcelWriter) -> None:
+        pd = _pd()
+
         utilidad_esperada_total = sum(p.expected_utility for p in game.payoffs)
 
         escenarios_normales = self._count_normal_scenarios(game.scenarios)
@@ -1,12 +1,14 @@
 from __future__ import annotations
-import pydot
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from Infrastructure.Export.naming_service import NamingService
 from Infrastructure.Common.logger import Logger
 from Infrastructure.Common.technical_validator import TechnicalValidator
 
+if TYPE_CHECKING:
+    import pydot
+
 
 class TreeExporter:
     def __init__(
@@ -54,6 +56,8 @@ class TreeExporter:
 
     #Casi-Listo Corregir el formato de los árboles
     def _build_pydot_from_game(self, game: Any) -> pydot.Dot:
+        import pydot
+
         graph = pydot.Dot(graph_type="digraph", rankdir="TB", bgcolor="white")
 
         for scenario in getattr(game, "scenarios", []):